@@ -2,6 +2,16 @@
 # A comprehensive collection of useful functions organized by category
 
 import math
+import os
+import sys
+
+# Shared algorithm modules live next to the Day 12 recursion examples:
+# flatten (Day12/flatten.py) and gcd (Day12/number_theory.py, the same
+# kernel Day 12 and Day 16 use) replace this file's own copies
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Day12"))
+
+from flatten import flatten
+from number_theory import gcd
 
 # ===== STRING UTILITIES =====
 
@@ -144,22 +154,6 @@ def is_prime(number):
     return True
 
 
-def gcd(a, b):
-    """
-    Find Greatest Common Divisor using Euclidean algorithm.
-    
-    Parameters:
-        a (int): First number
-        b (int): Second number
-    
-    Returns:
-        int: GCD of a and b
-    """
-    while b:
-        a, b = b, a % b
-    return a
-
-
 def fibonacci(n):
     """
     Generate Fibonacci sequence up to n terms.
@@ -232,14 +226,11 @@ def flatten_list(nested_list):
     
     Returns:
         list: Flattened list
+    
+    Uses the shared iterative engine from Day12/flatten.py, so any
+    depth of nesting works.
     """
-    flat = []
-    for item in nested_list:
-        if isinstance(item, list):
-            flat.extend(flatten_list(item))
-        else:
-            flat.append(item)
-    return flat
+    return flatten(nested_list, flatten_types=(list,))
 
 
 def chunk_list(items, chunk_size):
@@ -0,0 +1,405 @@
+# Caching Decorators - Day 11 Practice Project
+# Bounded, thread-safe memoization with LRU and TTL eviction
+
+"""
+Production-ready memoization.
+
+The memoize decorator in the original showcase kept every result
+forever, ignored keyword arguments, wasn't thread-safe and printed on
+every call. This version:
+
+    - evicts the least recently used entry beyond maxsize
+    - optionally expires entries after ttl seconds
+    - builds keys from positional and keyword arguments
+    - keeps hit/miss/eviction counts per function (cache_info())
+    - is silent unless verbose=True
+    - is safe to call from many threads
+
+Usage:
+    @memoize
+    def f(x): ...
+
+    @memoize(maxsize=1024, ttl=60)
+    def g(x, y=0): ...
+
+    g.cache_info()
+    g.cache_clear()
+
+disk_memoize adds a SQLite-backed tier so results survive restarts.
+"""
+
+import functools
+import hashlib
+import io
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+_KWARGS_MARK = object()
+
+
+def make_key(args, kwargs):
+    """
+    Hashable cache key for a call.
+
+    Keyword arguments are sorted, so f(a=1, b=2) and f(b=2, a=1) share
+    an entry.
+
+    Raises:
+        TypeError: If an argument is unhashable
+    """
+    if not kwargs:
+        key = args
+    else:
+        key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    hash(key)
+    return key
+
+
+class CacheInfo:
+    """Snapshot of a cache's statistics."""
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "size", "maxsize")
+
+    def __init__(self, hits, misses, evictions, expirations, size, maxsize):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.size = size
+        self.maxsize = maxsize
+
+    @property
+    def hit_rate(self):
+        """Fraction of calls answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __repr__(self):
+        return (f"CacheInfo(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, expirations={self.expirations}, "
+                f"size={self.size}, maxsize={self.maxsize})")
+
+
+def memoize(func=None, *, maxsize=128, ttl=None, verbose=False):
+    """
+    Cache function results with LRU eviction and optional expiry.
+
+    Args:
+        maxsize: Maximum entries kept, or None for no limit
+        ttl: Seconds an entry stays valid, or None for no expiry
+        verbose: Print cache hits and misses (for demos)
+
+    The lock is never held while func runs, so recursive functions
+    work and slow calls don't block other threads' cache hits. Two
+    threads missing on the same key at once may both compute it.
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1 (or None)")
+
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        clock = time.monotonic
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    value, expires_at = entry
+                    if expires_at is None or clock() < expires_at:
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        if verbose:
+                            print(f" Using cached result for {func.__name__}{args}")
+                        return value
+                    del cache[key]
+                    stats["expirations"] += 1
+                stats["misses"] += 1
+
+            value = func(*args, **kwargs)
+            expires_at = None if ttl is None else clock() + ttl
+
+            with lock:
+                cache[key] = (value, expires_at)
+                cache.move_to_end(key)
+                if maxsize is not None:
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+                        stats["evictions"] += 1
+
+            if verbose:
+                print(f" Cached result for {func.__name__}{args}")
+            return value
+
+        def cache_info():
+            """Current hit/miss/eviction counts and size."""
+            with lock:
+                return CacheInfo(size=len(cache), maxsize=maxsize, **stats)
+
+        def cache_clear():
+            """Empty the cache and reset its statistics."""
+            with lock:
+                cache.clear()
+                for name in stats:
+                    stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+# ===== PERSISTENT CACHE =====
+
+def _canonical(value):
+    """
+    Rewrite value so that equal values pickle to identical bytes.
+
+    Sets and dicts iterate in hash order, which changes between runs
+    (string hashing is randomized), so their items are sorted by their
+    own canonical pickles.
+    """
+    if isinstance(value, (set, frozenset)):
+        items = sorted((_canonical(item) for item in value), key=_stable_bytes)
+        return ("__set__", tuple(items))
+    if isinstance(value, dict):
+        items = sorted(((_canonical(k), _canonical(v)) for k, v in value.items()),
+                       key=_stable_bytes)
+        return ("__dict__", tuple(items))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_canonical(item) for item in value))
+    return value
+
+
+def _stable_bytes(value):
+    """
+    Pickle with a fixed protocol and no memo.
+
+    A normal pickle refers back to an object it has already written
+    (BINGET), so (a, a) and (a, b) pickle differently even when a == b.
+    Fast mode writes every object in full, so the bytes depend only on
+    the values.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=4)
+    pickler.fast = True
+    pickler.dump(value)
+    return buffer.getvalue()
+
+
+def stable_hash(*parts):
+    """SHA-256 hex digest of parts that is the same in every process."""
+    return hashlib.sha256(_stable_bytes(_canonical(parts))).hexdigest()
+
+
+# What pickling an arbitrary object can raise (lambdas, locks, cycles...)
+_UNPICKLABLE = (pickle.PicklingError, TypeError, AttributeError, ValueError,
+                RecursionError)
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value store for one namespace and version.
+
+    Entries of other versions in the same namespace are deleted when
+    the cache is opened, so bumping the version invalidates old results.
+    """
+
+    def __init__(self, path, namespace, version, max_bytes=None):
+        self.path = path
+        self.namespace = namespace
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY, namespace TEXT, version TEXT,"
+                " value BLOB, size INTEGER, accessed REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_lru ON cache (namespace, accessed)"
+            )
+            connection.execute(
+                "DELETE FROM cache WHERE namespace = ? AND version != ?",
+                (self.namespace, self.version),
+            )
+
+    def _connection(self):
+        """One connection per thread (sqlite3 connections aren't shared)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key):
+        """Return (found, value) for key."""
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        with connection:
+            connection.execute(
+                "UPDATE cache SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return True, pickle.loads(row[0])
+
+    def set(self, key, value):
+        """Store value under key, then evict old entries if over max_bytes."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, self.namespace, self.version, blob, len(blob), time.time()),
+            )
+        if self.max_bytes is not None:
+            return self._evict()
+        return 0
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes."""
+        connection = self._connection()
+        total = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        with connection:
+            rows = connection.execute(
+                "SELECT key, size FROM cache WHERE namespace = ? ORDER BY accessed",
+                (self.namespace,),
+            )
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            connection.executemany("DELETE FROM cache WHERE key = ?", doomed)
+        return len(doomed)
+
+    def clear(self):
+        """Delete every entry of this namespace."""
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+
+def disk_memoize(path, *, version=1, namespace=None, max_bytes=None,
+                 memory_size=128):
+    """
+    Cache results on disk so they survive restarts.
+
+    Args:
+        path: SQLite database file (shared by any number of functions)
+        version: Bump when the function's logic changes; entries stored
+            under another version are discarded
+        namespace: Cache namespace, default "module.qualname"
+        max_bytes: Evict least recently used entries beyond this many
+            bytes of pickled results, or None for no limit
+        memory_size: Entries kept in an in-memory LRU in front of the
+            database, or 0 to always go to disk
+
+    Arguments are hashed with SHA-256 over a canonical pickle, so the
+    same call maps to the same entry in every process. Calls whose
+    arguments can't be pickled run uncached, and unpicklable results
+    are only kept in memory.
+
+    Usage:
+        @disk_memoize("cache.db", version=2)
+        def expensive(x): ...
+    """
+    def decorator(func):
+        name = namespace or f"{func.__module__}.{func.__qualname__}"
+        store = DiskCache(path, name, version, max_bytes)
+        front = OrderedDict()
+        lock = threading.Lock()
+        stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0,
+                 "uncacheable": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = stable_hash(name, str(version), args, sorted(kwargs.items()))
+            except _UNPICKLABLE:
+                with lock:
+                    stats["uncacheable"] += 1
+                return func(*args, **kwargs)
+
+            with lock:
+                if key in front:
+                    front.move_to_end(key)
+                    stats["memory_hits"] += 1
+                    return front[key]
+
+            # Disk I/O and the call itself run outside the lock; the
+            # counters and the memory tier are updated under it.
+            found, value = store.get(key)
+            evicted = 0
+            uncacheable = False
+            if not found:
+                with lock:
+                    stats["misses"] += 1
+                value = func(*args, **kwargs)
+                try:
+                    evicted = store.set(key, value)
+                except _UNPICKLABLE:
+                    uncacheable = True
+
+            with lock:
+                if found:
+                    stats["disk_hits"] += 1
+                stats["evictions"] += evicted
+                stats["uncacheable"] += uncacheable
+                if memory_size:
+                    front[key] = value
+                    front.move_to_end(key)
+                    while len(front) > memory_size:
+                        front.popitem(last=False)
+            return value
+
+        def cache_info():
+            """Hit/miss counts for this process and entries on disk."""
+            with lock:
+                info = dict(stats)
+                info["memory_size"] = len(front)
+            info["disk_entries"] = len(store)
+            return info
+
+        def cache_clear():
+            """Forget every stored result for this function."""
+            with lock:
+                front.clear()
+            store.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,390 @@
+# Concurrency Decorators - Day 11 Practice Project
+# Share in-flight work between callers, for threads and asyncio alike
+
+"""
+Decorators for functions called from many threads or coroutines.
+
+memoize only helps once the first call has finished; ten threads that
+ask for the same report at the same moment still build it ten times.
+coalesce ("singleflight") lets the first caller run the function while
+identical concurrent calls wait for it and share its result or
+exception:
+
+    @coalesce
+    def load_report(day): ...
+
+    @coalesce
+    async def fetch(url): ...
+
+    load_report.coalesce_stats   # calls, executions, deduplicated
+
+Nothing is cached: once the call completes, the next caller runs the
+function again. Combine with memoize for that.
+
+rate_limit (token bucket) and concurrency_limit (slots) protect a
+resource from overload. Both work on regular and async functions, and
+functions passing the same key share one limiter:
+
+    @rate_limit(100, per=1.0, key="local-api")
+    def get(path): ...
+
+    @concurrency_limit(8, key="local-api")
+    async def post(path, body): ...
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+
+from caching import make_key
+
+
+class CoalesceStats:
+    """How many calls ran the function and how many shared a result."""
+
+    __slots__ = ("calls", "executions", "deduplicated", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+
+    def add(self, executed):
+        """Count one call that either ran the function or joined one."""
+        with self._lock:
+            self.calls += 1
+            if executed:
+                self.executions += 1
+            else:
+                self.deduplicated += 1
+
+    def __repr__(self):
+        return (f"CoalesceStats(calls={self.calls}, executions={self.executions}, "
+                f"deduplicated={self.deduplicated})")
+
+
+class _InFlight:
+    """A running sync call that other threads can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def coalesce(func):
+    """
+    Run concurrent identical calls of func only once.
+
+    Calls are identical when their arguments produce the same
+    caching.make_key (so arguments must be hashable). Followers get the
+    leader's return value, or the same exception raised again.
+
+    For coroutine functions the work runs as a task that every caller
+    awaits through asyncio.shield, so a cancelled caller doesn't cancel
+    it for the others. Coalescing happens per event loop.
+    """
+    stats = CoalesceStats()
+    lock = threading.Lock()
+
+    if inspect.iscoroutinefunction(func):
+        tasks = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (asyncio.get_running_loop(), make_key(args, kwargs))
+            task = tasks.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                tasks[key] = task
+                task.add_done_callback(lambda _, key=key: tasks.pop(key, None))
+                stats.add(executed=True)
+            else:
+                stats.add(executed=False)
+            return await asyncio.shield(task)
+    else:
+        calls = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with lock:
+                call = calls.get(key)
+                leader = call is None
+                if leader:
+                    call = calls[key] = _InFlight()
+            stats.add(executed=leader)
+
+            if not leader:
+                call.done.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = func(*args, **kwargs)
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with lock:
+                    del calls[key]
+                call.done.set()
+
+    wrapper.coalesce_stats = stats
+    return wrapper
+
+
+# ===== LIMITS =====
+
+class RateLimitExceeded(Exception):
+    """Raised by a non-blocking rate_limit when no call is available."""
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised by a non-blocking concurrency_limit when every slot is busy."""
+
+
+class TokenBucket:
+    """
+    Allow `calls` calls per `per` seconds, with bursts up to `calls`.
+
+    Blocking callers reserve a token up front (the bucket may go
+    negative) and sleep until it has refilled, so waiters are served in
+    arrival order without polling. Safe to share between threads and
+    event loops.
+    """
+
+    def __init__(self, calls, per):
+        if calls < 1 or per <= 0:
+            raise ValueError("calls must be at least 1 and per positive")
+        self.calls = calls
+        self.per = per
+        self.rate = calls / per
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.calls, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """Take a token if one is available right now."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def reserve(self):
+        """Take a token, returning how many seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class ConcurrencyLimiter:
+    """
+    At most `limit` calls running at once, shared by threads and coroutines.
+
+    Waiting threads block on an Event, waiting coroutines await a
+    future; a finishing call hands its slot straight to the oldest
+    waiter.
+    """
+
+    def __init__(self, limit):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.active = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Take a slot if one is free and nobody is queued."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return True
+            return False
+
+    def acquire(self):
+        """Take a slot, blocking the thread until one is handed over."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        waiter.wait()
+
+    async def acquire_async(self):
+        """Take a slot without blocking the event loop."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            if not queued and waiter.done() and not waiter.cancelled():
+                self.release()  # the slot arrived just as we were cancelled
+            raise
+
+    def _grant(self, future):
+        """Hand a slot to an async waiter (runs on its event loop)."""
+        if future.done():
+            self.release()  # cancelled before the slot arrived
+        else:
+            future.set_result(None)
+
+    def release(self):
+        """Give the slot to the oldest waiter, or free it."""
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            waiter = self._waiters.popleft()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+
+
+_rate_limiters = {}
+_concurrency_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _shared(registry, key, factory, settings):
+    """Limiter registered under key, created by factory on first use."""
+    if key is None:
+        return factory()
+    with _limiters_lock:
+        entry = registry.get(key)
+        if entry is None:
+            entry = registry[key] = (settings, factory())
+        elif entry[0] != settings:
+            raise ValueError(f"Limiter {key!r} already exists with settings {entry[0]}")
+        return entry[1]
+
+
+def rate_limit(calls, per=1.0, *, block=True, key=None):
+    """
+    Allow at most `calls` calls every `per` seconds (token bucket).
+
+    Args:
+        calls: Calls allowed per period (also the largest burst)
+        per: Period length in seconds
+        block: Wait for a token (asyncio.sleep for coroutines) or, if
+            False, raise RateLimitExceeded immediately
+        key: Share one bucket between every function using this key
+
+    Raises:
+        ValueError: If key is already used with other settings
+    """
+    def decorator(func):
+        bucket = _shared(_rate_limiters, key, lambda: TokenBucket(calls, per),
+                         (calls, per))
+        name = func.__qualname__
+
+        def rejected():
+            return RateLimitExceeded(f"{name}: more than {calls} calls per {per}s")
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not block:
+                    if not bucket.try_acquire():
+                        raise rejected()
+                else:
+                    wait = bucket.reserve()
+                    if wait:
+                        await asyncio.sleep(wait)
+                return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not block:
+                    if not bucket.try_acquire():
+                        raise rejected()
+                else:
+                    wait = bucket.reserve()
+                    if wait:
+                        time.sleep(wait)
+                return func(*args, **kwargs)
+
+        wrapper.limiter = bucket
+        return wrapper
+
+    return decorator
+
+
+def concurrency_limit(limit, *, block=True, key=None):
+    """
+    Allow at most `limit` calls to run at the same time.
+
+    Args:
+        limit: Simultaneous calls allowed
+        block: Wait for a free slot or, if False, raise
+            ConcurrencyLimitExceeded immediately
+        key: Share one limit between every function using this key,
+            across threads and event loops
+
+    Raises:
+        ValueError: If key is already used with another limit
+    """
+    def decorator(func):
+        limiter = _shared(_concurrency_limiters, key,
+                          lambda: ConcurrencyLimiter(limit), limit)
+        name = func.__qualname__
+
+        def rejected():
+            return ConcurrencyLimitExceeded(f"{name}: {limit} calls already running")
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not block:
+                    if not limiter.try_acquire():
+                        raise rejected()
+                else:
+                    await limiter.acquire_async()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    limiter.release()
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not block:
+                    if not limiter.try_acquire():
+                        raise rejected()
+                else:
+                    limiter.acquire()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    limiter.release()
+
+        wrapper.limiter = limiter
+        return wrapper
+
+    return decorator
@@ -0,0 +1,149 @@
+# Debug Tracer - Day 11 Practice Project
+# Sampled call tracing into a ring buffer, cheap enough to leave on
+
+"""
+A debug decorator for hot code.
+
+The showcase's debug decorator builds a full repr of every argument and
+prints twice per call. traced instead:
+
+    - records only one call in sample_every (failing calls always)
+    - stores the raw arguments and result, and builds truncated reprs
+      with reprlib only when the buffer is dumped
+    - keeps the newest entries in a fixed-size ring buffer
+    - can dump the buffer to a file or stderr whenever a traced
+      function raises
+
+Usage:
+    @traced(sample_every=100, dump_on_error="debug_dump.txt")
+    def parse(line): ...
+
+    print(trace_buffer.dump())
+
+Entries hold references to the real arguments, so an argument mutated
+after the call shows its newer value in the dump.
+"""
+
+import functools
+import itertools
+import reprlib
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+
+class TraceBuffer:
+    """Fixed-size buffer of the most recent traced calls."""
+
+    def __init__(self, capacity=1000, max_repr=80):
+        self.capacity = capacity
+        self.max_repr = max_repr
+        self._entries = deque(maxlen=capacity)
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = max_repr
+        self._repr.maxother = max_repr
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, name, args, kwargs, outcome, failed, duration_ns):
+        """Store one call; the oldest entry drops out when full."""
+        self._entries.append((time.time(), threading.get_ident(), name, args,
+                              kwargs, outcome, failed, duration_ns))
+
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
+
+    def _format(self, entry):
+        """One line of text for an entry (reprs are built here)."""
+        timestamp, thread, name, args, kwargs, outcome, failed, duration_ns = entry
+        short = self._repr.repr
+        when = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S.%f")[:-3]
+        signature = ", ".join([short(arg) for arg in args] +
+                              [f"{key}={short(value)}" for key, value in kwargs.items()])
+        if failed:
+            message = str(outcome)
+            if len(message) > self.max_repr:
+                message = message[:self.max_repr - 3] + "..."
+            result = f"raised {type(outcome).__name__}: {message}"
+        else:
+            result = f"returned {short(outcome)}"
+        line = f"[{when}] thread {thread} {name}({signature}) {result}"
+        if duration_ns is not None:
+            line += f" in {duration_ns / 1000:.1f} µs"
+        return line
+
+    def lines(self):
+        """Formatted entries, oldest first."""
+        return [self._format(entry) for entry in list(self._entries)]
+
+    def dump(self, file=None):
+        """
+        Format the buffer.
+
+        Args:
+            file: Filename to append to, an open file, or None
+
+        Returns:
+            The dumped text
+        """
+        text = "\n".join(self.lines())
+        if file is None:
+            return text
+        if isinstance(file, str):
+            with open(file, 'a', encoding='utf-8') as handle:
+                handle.write(text + "\n")
+        else:
+            file.write(text + "\n")
+        return text
+
+
+trace_buffer = TraceBuffer()
+
+
+def traced(func=None, *, sample_every=100, buffer=None, dump_on_error=None):
+    """
+    Record a sample of calls to func in a ring buffer.
+
+    Args:
+        sample_every: Record one call in this many (1 records all)
+        buffer: TraceBuffer to record into, default trace_buffer
+        dump_on_error: When func raises, dump the buffer here: a
+            filename, an open file, True for stderr, or None
+
+    Calls that raise are always recorded, sampled or not.
+    """
+    if sample_every < 1:
+        raise ValueError("sample_every must be at least 1")
+
+    def decorator(func):
+        target = buffer if buffer is not None else trace_buffer
+        name = func.__qualname__
+        ticket = itertools.count()
+        clock = time.perf_counter_ns
+        dump_target = sys.stderr if dump_on_error is True else dump_on_error
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            sampled = next(ticket) % sample_every == 0
+            start = clock() if sampled else 0
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                target.record(name, args, kwargs, e, True,
+                              clock() - start if sampled else None)
+                if dump_target is not None:
+                    target.dump(dump_target)
+                raise
+            if sampled:
+                target.record(name, args, kwargs, result, False, clock() - start)
+            return result
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
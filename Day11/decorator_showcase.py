@@ -3,19 +3,30 @@
 
 import time
 import functools
-from datetime import datetime
+import threading
+
+from caching import memoize
+from concurrency import RateLimitExceeded, coalesce, concurrency_limit, rate_limit
+from debug_tracer import TraceBuffer, traced
+from instrumentation import counted, counters, profiled, registry
+from log_writer import log_to_file
+from retrying import retry
+from type_checks import typechecked
 
 # ===== UTILITY DECORATORS =====
 
 def timer(func):
     """
     Measure and print function execution time.
+    
+    For code that stays instrumented, use instrumentation.profiled:
+    it records quietly into histograms instead of printing.
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         print(f"⏱️  {func.__name__} took {end - start:.4f} seconds")
         return result
     return wrapper
@@ -24,6 +35,9 @@ def timer(func):
 def debug(func):
     """
     Print function call details for debugging.
+    
+    For hot code, debug_tracer.traced samples calls into a ring
+    buffer instead of printing.
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -42,6 +56,9 @@ def debug(func):
 def count_calls(func):
     """
     Count how many times a function is called.
+    
+    instrumentation.counted counts without printing, in per-thread
+    cells summed on read, and adds a registry, sampling and dumps.
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -61,6 +78,9 @@ def validate_types(*expected_types):
         @validate_types(int, int)
         def add(a, b):
             return a + b
+    
+    type_checks.typechecked reads the annotations instead and also
+    checks keywords, Optional and unions.
     """
     def decorator(func):
         @functools.wraps(func)
@@ -77,67 +97,17 @@ def validate_types(*expected_types):
     return decorator
 
 
-def memoize(func):
-    """
-    Cache function results for same arguments.
-    """
-    cache = {}
-    
-    @functools.wraps(func)
-    def wrapper(*args):
-        if args in cache:
-            print(f" Using cached result for {func.__name__}{args}")
-            return cache[args]
-        
-        result = func(*args)
-        cache[args] = result
-        print(f" Cached result for {func.__name__}{args}")
-        return result
-    
-    return wrapper
+# memoize lives in caching.py: bounded LRU/TTL cache, kwargs-aware
+# keys, per-function statistics, thread-safe and silent by default.
 
 
-def retry(max_attempts=3, delay=1):
-    """
-    Retry function on failure.
-    
-    Args:
-        max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
-    """
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts - 1:
-                        print(f" All {max_attempts} attempts failed")
-                        raise
-                    print(f"  Attempt {attempt + 1} failed: {e}")
-                    print(f" Retrying in {delay} seconds...")
-                    time.sleep(delay)
-        return wrapper
-    return decorator
+# retry lives in retrying.py: async-aware, exponential or
+# decorrelated-jitter backoff, exception allowlist, overall deadline
+# and per-function metrics.
 
 
-def log_to_file(filename="function_log.txt"):
-    """
-    Log function calls to a file.
-    """
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_msg = f"[{timestamp}] {func.__name__} called with args={args}, kwargs={kwargs}\n"
-            
-            # In real application, write to file
-            print(f" Logging: {log_msg.strip()}")
-            
-            return func(*args, **kwargs)
-        return wrapper
-    return decorator
+# log_to_file lives in log_writer.py: records are queued and written
+# in batches by a background thread, with size-based rotation.
 
 
 def deprecated(message="This function is deprecated"):
@@ -162,13 +132,19 @@ def slow_operation():
     return "Operation completed"
 
 
+@profiled
+def calculate_square(x):
+    """Square a number (cheap enough to profile on every call)."""
+    return x * x
+
+
 @debug
 def calculate_sum(a, b):
     """Add two numbers with debugging."""
     return a + b
 
 
-@count_calls
+@counted
 def greet(name):
     """Greet a person."""
     return f"Hello, {name}!"
@@ -182,7 +158,14 @@ def divide(a, b):
     return a / b
 
 
-@memoize
+@typechecked
+def format_price(amount: float, currency: str = "USD", note: str | None = None):
+    """Format a price, type-checked from its annotations."""
+    text = f"{amount:.2f} {currency}"
+    return f"{text} ({note})" if note else text
+
+
+@memoize(maxsize=256, verbose=True)
 def fibonacci(n):
     """Calculate Fibonacci number (expensive without memoization)."""
     if n <= 1:
@@ -190,7 +173,7 @@ def fibonacci(n):
     return fibonacci(n - 1) + fibonacci(n - 2)
 
 
-@retry(max_attempts=3, delay=0.5)
+@retry(max_attempts=3, delay=0.5, policy="exponential", verbose=True)
 def unstable_operation():
     """Simulate an unstable operation."""
     import random
@@ -289,7 +272,8 @@ def display_menu():
     print("12. Lambda Functions Demo")
     print("13. Higher-Order Functions Demo")
     print("14. *args and **kwargs Demo")
-    print("15. Exit")
+    print("15. Concurrency Decorators")
+    print("16. Exit")
     print("=" * 60)
 
 
@@ -299,6 +283,11 @@ def demo_timer():
     print("Measuring execution time of slow operation...\n")
     result = slow_operation()
     print(f"Result: {result}")
+    
+    print("\nProfiling 1,000 calls of calculate_square() quietly...\n")
+    for i in range(1000):
+        calculate_square(i)
+    print(registry.summary_table())
 
 
 def demo_debug():
@@ -307,6 +296,21 @@ def demo_debug():
     print("Debugging function call...\n")
     result = calculate_sum(10, 20)
     print(f"\nFinal result: {result}")
+    
+    print("\nTracing 1,000 calls, keeping 1 in 250 in a ring buffer...\n")
+    buffer = TraceBuffer(capacity=10)
+    
+    @traced(sample_every=250, buffer=buffer)
+    def parse_number(text):
+        return int(text)
+    
+    for i in range(1000):
+        parse_number(str(i))
+    try:
+        parse_number("oops")
+    except ValueError:
+        pass
+    print(buffer.dump())
 
 
 def demo_count_calls():
@@ -316,7 +320,8 @@ def demo_count_calls():
     greet("Alice")
     greet("Bob")
     greet("Charlie")
-    print(f"\nTotal calls: {greet.calls}")
+    print(f"\nTotal calls: {greet.call_count()}")
+    print(f"All counted functions: {counters.counts()}")
 
 
 def demo_validate_types():
@@ -336,6 +341,15 @@ def demo_validate_types():
         print(f" Result: {result}")
     except TypeError as e:
         print(f" Error: {e}")
+    
+    print("\nAnnotation-based checks: format_price(5, note='sale')")
+    print(f" Result: {format_price(5, note='sale')}")
+    
+    print("\nInvalid keyword: format_price(5, currency=978)")
+    try:
+        format_price(5, currency=978)
+    except TypeError as e:
+        print(f" Error: {e}")
 
 
 def demo_memoize():
@@ -349,6 +363,8 @@ def demo_memoize():
     print("\nCalling fibonacci(10) again (should use cache)...")
     result = fibonacci(10)
     print(f"Result: {result}")
+    
+    print(f"\nCache statistics: {fibonacci.cache_info()}")
 
 
 def demo_retry():
@@ -361,6 +377,8 @@ def demo_retry():
         print(f" {result}")
     except Exception as e:
         print(f" Final error: {e}")
+    
+    print(f"\nRetry statistics: {unstable_operation.retry_stats}")
 
 
 def demo_log_to_file():
@@ -369,6 +387,13 @@ def demo_log_to_file():
     print("Processing data with logging...\n")
     result = process_data([1, 2, 3, 4, 5])
     print(f"Result: {result}")
+    
+    writer = process_data.get_log_writer()
+    writer.flush()
+    with open(writer.filename) as file:
+        last_line = file.readlines()[-1].strip()
+    print(f"\nLast line of {writer.filename}:")
+    print(f"  {last_line}")
 
 
 def demo_deprecated():
@@ -475,6 +500,58 @@ def demo_args_kwargs():
     flexible_function(1, 2, 3, name='Alice', age=25)
 
 
+def demo_concurrency():
+    """Demonstrate request coalescing, rate limits and concurrency limits."""
+    print("\n--- Concurrency Decorators Demo ---")
+    print("8 threads ask for the same slow report at once...\n")
+    
+    @coalesce
+    def build_report(day):
+        time.sleep(0.3)
+        return f"Report for {day}"
+    
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(build_report("monday")))
+               for _ in range(8)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    print(f" {len(results)} results in {time.perf_counter() - start:.2f} seconds")
+    print(f" {build_report.coalesce_stats}")
+    
+    print("\nRate limit of 5 calls per second, 10 calls without waiting...\n")
+    
+    @rate_limit(5, per=1.0, block=False)
+    def ping(n):
+        return n
+    
+    accepted = rejected = 0
+    for i in range(10):
+        try:
+            ping(i)
+            accepted += 1
+        except RateLimitExceeded:
+            rejected += 1
+    print(f" Accepted: {accepted}, rejected: {rejected}")
+    
+    print("\nConcurrency limit of 2, 6 threads doing 0.2s of work...\n")
+    
+    @concurrency_limit(2)
+    def query():
+        time.sleep(0.2)
+    
+    threads = [threading.Thread(target=query) for _ in range(6)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f" Finished in {time.perf_counter() - start:.2f} seconds (3 rounds of 2)")
+
+
 def main():
     """Main program."""
     print("Welcome to Decorator Showcase!")
@@ -482,7 +559,7 @@ def main():
     
     while True:
         display_menu()
-        choice = input("\nEnter your choice (1-15): ")
+        choice = input("\nEnter your choice (1-16): ")
         
         if choice == '1':
             demo_timer()
@@ -513,11 +590,13 @@ def main():
         elif choice == '14':
             demo_args_kwargs()
         elif choice == '15':
+            demo_concurrency()
+        elif choice == '16':
             print("\n Thanks for exploring decorators!")
             print("Keep coding with style! ")
             break
         else:
-            print("\n✗ Invalid choice! Please select 1-15.")
+            print("\n✗ Invalid choice! Please select 1-16.")
         
         input("\nPress Enter to continue...")
 
@@ -0,0 +1,424 @@
+# Instrumentation Decorators - Day 11 Practice Project
+# Always-on timing histograms that cost almost nothing when switched off
+
+"""
+Low-overhead profiling for production code.
+
+The showcase's timer decorator uses time.time() and prints every call,
+which is too coarse for fast functions and too noisy to leave in place.
+profiled instead records perf_counter_ns durations into a per-function
+histogram with logarithmic buckets (8 per power of two, so any
+percentile is within about 6% of the true value) held in a global
+registry:
+
+    @profiled
+    def handle(request): ...
+
+    registry.summary_table()    # count, mean, p50, p95, p99, max
+    registry.write_json("profile.json")
+
+    registry.enabled = False    # wrappers now cost one attribute check
+
+counted replaces the showcase's count_calls, which kept an unlocked
+counter on the function and printed every call:
+
+    @counted
+    def greet(name): ...
+
+    counters.counts()           # {"app.greet": 3, ...}
+"""
+
+import functools
+import json
+import random
+import threading
+import time
+
+# ===== HISTOGRAM =====
+
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = 64 * SUB_BUCKETS
+_SUB_MASK = SUB_BUCKETS - 1
+
+
+def bucket_index(value):
+    """
+    Histogram bucket for a non-negative integer.
+
+    Values below SUB_BUCKETS get a bucket each; larger values keep their
+    top SUB_BUCKET_BITS + 1 bits, so bucket width grows with the value.
+    """
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return ((shift + 1) << SUB_BUCKET_BITS) | ((value >> shift) & (SUB_BUCKETS - 1))
+
+
+def bucket_bounds(index):
+    """(low, high) range of values falling into bucket index, high exclusive."""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    low = (SUB_BUCKETS | (index & (SUB_BUCKETS - 1))) << shift
+    return low, low + (1 << shift)
+
+
+class Histogram:
+    """Log-bucketed histogram of durations in nanoseconds."""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Drop every recorded duration."""
+        with self._lock:
+            self.counts = [0] * BUCKET_COUNT
+            self.count = 0
+            self.total = 0
+            self.min = float('inf')
+            self.max = 0
+
+    def record(self, value):
+        """Add one duration (bucket_index inlined: this runs on every call)."""
+        if value < SUB_BUCKETS:
+            index = value
+        else:
+            shift = value.bit_length() - SUB_BUCKET_BITS - 1
+            index = ((shift + 1) << SUB_BUCKET_BITS) | ((value >> shift) & _SUB_MASK)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+            if value < self.min:
+                self.min = value
+
+    @property
+    def mean(self):
+        """Exact mean duration, or 0 when empty."""
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, p):
+        """
+        Approximate p-th percentile (0-100).
+
+        Returns the midpoint of the bucket holding the value, clamped to
+        the exact minimum and maximum seen.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min(max((low + high - 1) / 2, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """Dict of count, min, mean, p50, p95, p99 and max (nanoseconds)."""
+        with self._lock:
+            return {
+                "count": self.count,
+                "min_ns": self.min if self.count else 0,
+                "mean_ns": self.mean,
+                "p50_ns": self.percentile(50),
+                "p95_ns": self.percentile(95),
+                "p99_ns": self.percentile(99),
+                "max_ns": self.max,
+            }
+
+
+# ===== REGISTRY =====
+
+def format_ns(ns):
+    """Human-readable duration for a nanosecond value."""
+    if ns < 1_000:
+        return f"{ns:.0f} ns"
+    if ns < 1_000_000:
+        return f"{ns / 1_000:.1f} µs"
+    if ns < 1_000_000_000:
+        return f"{ns / 1_000_000:.1f} ms"
+    return f"{ns / 1_000_000_000:.2f} s"
+
+
+class ProfileRegistry:
+    """Histograms of every profiled function, with a runtime on/off switch."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        """Histogram for name, created on first use."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram(name))
+        return histogram
+
+    def reset(self):
+        """Forget all recorded durations (decorated functions keep recording)."""
+        for histogram in list(self.histograms.values()):
+            histogram.clear()
+
+    def profiled(self, func=None, *, name=None):
+        """
+        Decorator recording func's duration on every call.
+
+        The histogram is named "module.qualname" unless name is given.
+        """
+        def decorator(func):
+            histogram = self.histogram(name or f"{func.__module__}.{func.__qualname__}")
+            clock = time.perf_counter_ns
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = clock()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.record(clock() - start)
+
+            return wrapper
+
+        if func is not None:
+            return decorator(func)
+        return decorator
+
+    # ===== REPORTING =====
+
+    def report(self):
+        """Dict mapping function name to its summary()."""
+        return {name: histogram.summary()
+                for name, histogram in list(self.histograms.items())}
+
+    def to_json(self, indent=2):
+        """Report as a JSON string."""
+        return json.dumps(self.report(), indent=indent)
+
+    def write_json(self, filename):
+        """Write the report to a JSON file."""
+        with open(filename, 'w') as file:
+            file.write(self.to_json())
+
+    def summary_table(self):
+        """Text table with one row per profiled function."""
+        header = (f"{'Function':<28} {'Calls':>10} {'Mean':>10} {'p50':>10} "
+                  f"{'p95':>10} {'p99':>10} {'Max':>10}")
+        lines = [header, "-" * len(header)]
+        for name, summary in self.report().items():
+            lines.append(
+                f"{name:<28} {summary['count']:>10,} "
+                f"{format_ns(summary['mean_ns']):>10} "
+                f"{format_ns(summary['p50_ns']):>10} "
+                f"{format_ns(summary['p95_ns']):>10} "
+                f"{format_ns(summary['p99_ns']):>10} "
+                f"{format_ns(summary['max_ns']):>10}"
+            )
+        return "\n".join(lines)
+
+
+registry = ProfileRegistry()
+
+
+def profiled(func=None, *, name=None):
+    """
+    Record func's durations in the module-level registry.
+
+    Usage:
+        @profiled
+        def f(): ...
+
+        @profiled(name="db.query")
+        def query(sql): ...
+    """
+    return registry.profiled(func, name=name)
+
+
+# ===== CALL COUNTERS =====
+
+class CallCounter:
+    """
+    Call count kept in one cell per thread.
+
+    Each thread only ever writes its own cell, so increments need no
+    lock and are never lost; count() sums the cells when read.
+    """
+
+    def __init__(self, name, sample_rate=1.0):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.name = name
+        self.sample_rate = sample_rate
+        self._local = threading.local()
+        self._cells = []
+        self._baseline = 0
+        self._lock = threading.Lock()
+
+    def cell(self):
+        """This thread's [count] cell, registered on first use."""
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = self._local.cell = [0]
+            with self._lock:
+                self._cells.append(cell)
+        return cell
+
+    def raw_count(self):
+        """Increments recorded since the last reset (sampled calls only)."""
+        with self._lock:
+            cells = list(self._cells)
+        return sum(cell[0] for cell in cells) - self._baseline
+
+    def count(self):
+        """Calls since the last reset (an estimate when sampling)."""
+        raw = self.raw_count()
+        if self.sample_rate == 1.0:
+            return raw
+        return round(raw / self.sample_rate)
+
+    def reset(self):
+        """Start counting from zero again."""
+        self._baseline += self.raw_count()
+
+
+class CounterRegistry:
+    """Every CallCounter by name, plus optional periodic dumps to a file."""
+
+    def __init__(self):
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._dump_thread = None
+        self._dump_stop = None
+        self._dump_filename = None
+
+    def counter(self, name, sample_rate=1.0):
+        """
+        CallCounter for name, created on first use.
+
+        Raises:
+            ValueError: If name already counts with another sample_rate
+        """
+        with self._lock:
+            counter = self.counters.get(name)
+            if counter is None:
+                counter = self.counters[name] = CallCounter(name, sample_rate)
+            elif counter.sample_rate != sample_rate:
+                raise ValueError(f"Counter {name!r} already exists with "
+                                 f"sample_rate {counter.sample_rate}")
+            return counter
+
+    def counted(self, func=None, *, name=None, sample_rate=1.0):
+        """
+        Decorator counting calls to func.
+
+        With sample_rate below 1 only that fraction of calls touch the
+        counter, and count() scales the result back up. The counter is
+        named "module.qualname" unless name is given.
+        """
+        def decorator(func):
+            counter = self.counter(name or f"{func.__module__}.{func.__qualname__}",
+                                   sample_rate)
+            cell = counter.cell
+            local = counter._local
+
+            if sample_rate == 1.0:
+                @functools.wraps(func)
+                def wrapper(*args, **kwargs):
+                    try:
+                        local.cell[0] += 1
+                    except AttributeError:
+                        cell()[0] += 1
+                    return func(*args, **kwargs)
+            else:
+                @functools.wraps(func)
+                def wrapper(*args, **kwargs):
+                    if random.random() < sample_rate:
+                        cell()[0] += 1
+                    return func(*args, **kwargs)
+
+            wrapper.call_count = counter.count
+            return wrapper
+
+        if func is not None:
+            return decorator(func)
+        return decorator
+
+    def counts(self):
+        """Dict mapping function name to its call count."""
+        with self._lock:
+            counters = list(self.counters.values())
+        return {counter.name: counter.count() for counter in counters}
+
+    def reset(self):
+        """Reset every counter to zero."""
+        with self._lock:
+            counters = list(self.counters.values())
+        for counter in counters:
+            counter.reset()
+
+    # ===== DUMPING =====
+
+    def dump(self, filename):
+        """Append the current counts to filename as one JSON line."""
+        record = {"time": time.time(), "counts": self.counts()}
+        with open(filename, 'a') as file:
+            file.write(json.dumps(record) + "\n")
+
+    def start_dumping(self, filename, interval=60.0):
+        """
+        Dump counts to filename every interval seconds in a daemon thread.
+
+        Raises:
+            RuntimeError: If a dump thread is already running
+        """
+        if self._dump_thread is not None:
+            raise RuntimeError("Already dumping counters")
+
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                self.dump(filename)
+
+        self._dump_stop = stop
+        self._dump_thread = threading.Thread(target=loop, name="counter-dump",
+                                             daemon=True)
+        self._dump_thread.start()
+        self._dump_filename = filename
+
+    def stop_dumping(self):
+        """Stop the dump thread and write one final dump."""
+        if self._dump_thread is None:
+            return
+        self._dump_stop.set()
+        self._dump_thread.join()
+        self._dump_thread = None
+        self.dump(self._dump_filename)
+
+
+counters = CounterRegistry()
+
+
+def counted(func=None, *, name=None, sample_rate=1.0):
+    """
+    Count calls to func in the module-level counter registry.
+
+    Usage:
+        @counted
+        def f(): ...
+
+        f.call_count()
+        counters.counts()
+        counters.start_dumping("calls.jsonl", interval=30)
+    """
+    return counters.counted(func, name=name, sample_rate=sample_rate)
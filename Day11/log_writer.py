@@ -0,0 +1,220 @@
+# Buffered Call Logging - Day 11 Practice Project
+# Log function calls to a file without a write per call
+
+"""
+log_to_file that really writes, cheaply.
+
+Decorated functions only append a raw record (timestamp, name, args,
+kwargs) to an in-memory queue. One background thread per log file
+drains the queue in batches, builds the text with reprlib so huge
+arguments are cut short, writes it in one go and rotates the file by
+size:
+
+    function_log.txt      <- current
+    function_log.txt.1    <- previous
+    function_log.txt.2    ...
+
+Batches are written when flush_size records are waiting or every
+flush_interval seconds, whichever comes first. The file and thread are
+only created by the first logged call. Every writer is flushed and
+closed when the interpreter exits; records submitted after that, or
+beyond max_pending, are dropped and counted.
+
+Arguments are formatted in the background, after the call has run, so
+an argument that the function mutates is logged as it was at write time.
+"""
+
+import atexit
+import functools
+import os
+import reprlib
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+
+class LogWriter:
+    """Background-thread writer with batching and size-based rotation."""
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=3,
+                 flush_size=1000, flush_interval=1.0, max_repr=80,
+                 max_pending=100_000):
+        """
+        Args:
+            filename: Log file path
+            max_bytes: Rotate once the file reaches this size
+            backup_count: Rotated files kept (0 truncates instead)
+            flush_size: Wake the writer once this many records wait
+            flush_interval: Seconds between writes otherwise
+            max_repr: Longest repr written for one argument
+            max_pending: Records allowed to wait; beyond that (or once
+                the writer is closed or has failed) records are dropped
+                and counted in `dropped`
+        """
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.records_written = 0
+        self.dropped = 0
+        self.error = None
+
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = max_repr
+        self._repr.maxother = max_repr
+        self._repr.maxlist = self._repr.maxtuple = self._repr.maxdict = 10
+
+        self._pending = deque()
+        self._wake = threading.Event()
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self._file = open(filename, 'a', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, name=f"log-writer:{filename}",
+                                         daemon=True)
+        self._thread.start()
+
+    def submit(self, name, args, kwargs):
+        """Queue one call record (cheap; no formatting or I/O here)."""
+        if self._closed or len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append((time.time(), name, args, kwargs))
+        if len(self._pending) >= self.flush_size:
+            self._wake.set()
+
+    def _format(self, record):
+        """One log line for a queued record."""
+        timestamp, name, args, kwargs = record
+        when = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        args_repr = self._repr.repr(args)
+        kwargs_repr = self._repr.repr(kwargs)
+        return f"[{when}] {name} called with args={args_repr}, kwargs={kwargs_repr}\n"
+
+    def _run(self):
+        try:
+            while not self._closed:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                self.flush()
+        except Exception as e:
+            # e.g. disk full: stop accepting records instead of queueing forever
+            self.error = e
+            self._closed = True
+            self._pending.clear()
+            print(f"✗ Log writer for '{self.filename}' stopped: {e}")
+
+    def flush(self):
+        """Write every queued record now, rotating as the file fills up."""
+        with self._io_lock:
+            pending = self._pending
+            if not pending or self._file is None:
+                return
+            size = self._file.tell()
+            lines = []
+            while pending:
+                line = self._format(pending.popleft())
+                lines.append(line)
+                size += len(line)
+                if size >= self.max_bytes:
+                    self._write(lines)
+                    self._rotate()
+                    size = 0
+                    lines = []
+            self._write(lines)
+            self._file.flush()
+
+    def _write(self, lines):
+        """Write a batch of formatted lines."""
+        self._file.write("".join(lines))
+        self.records_written += len(lines)
+
+    def _rotate(self):
+        """Shift filename -> filename.1 -> filename.2 ... and start afresh."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.filename}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.filename}.{index + 1}")
+            os.replace(self.filename, f"{self.filename}.1")
+            self._file = open(self.filename, 'a', encoding='utf-8')
+        else:
+            self._file = open(self.filename, 'w', encoding='utf-8')
+
+    def close(self):
+        """Stop the writer thread after writing what is queued."""
+        if self._file is None:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        try:
+            if self.error is None:
+                self.flush()
+        finally:
+            with self._io_lock:
+                self._file.close()
+                self._file = None
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(filename, **options):
+    """
+    Shared LogWriter for filename, created on first use.
+
+    Options only apply when the writer is created.
+    """
+    key = os.path.abspath(filename)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = LogWriter(filename, **options)
+        return writer
+
+
+@atexit.register
+def close_all():
+    """Flush and close every shared writer."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+def log_to_file(filename="function_log.txt", **options):
+    """
+    Log function calls to a file.
+
+    Args:
+        filename: Log file; functions logging to the same file share
+            one writer
+        **options: LogWriter settings (max_bytes, backup_count,
+            flush_size, flush_interval, max_repr)
+    """
+    def decorator(func):
+        name = func.__name__
+        writer = None
+
+        def get_log_writer():
+            """The shared writer, opened on first use (not at import)."""
+            nonlocal writer
+            if writer is None:
+                writer = get_writer(filename, **options)
+            return writer
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            (writer or get_log_writer()).submit(name, args, kwargs)
+            return func(*args, **kwargs)
+
+        wrapper.get_log_writer = get_log_writer
+        return wrapper
+
+    return decorator
@@ -0,0 +1,204 @@
+# Retry Decorator - Day 11 Practice Project
+# Retries with backoff for both regular and async functions
+
+"""
+Retry failed calls without blocking the event loop or stampeding.
+
+The showcase's original retry slept a fixed delay with time.sleep,
+retried every exception and only wrapped regular functions. This
+version:
+
+    - wraps coroutine functions too, sleeping with asyncio.sleep
+    - backs off with a fixed, exponential or decorrelated-jitter delay
+    - retries only the exception types listed in retry_on
+    - gives up when an overall deadline would be passed
+    - counts attempts, retries and give-ups per function
+
+Usage:
+    @retry(max_attempts=5, delay=0.1, policy="decorrelated",
+           retry_on=(ConnectionError,), deadline=10)
+    async def fetch(url): ...
+
+    fetch.retry_stats               # this function's RetryStats
+    retry_metrics["app.fetch"]      # same, looked up by module.qualname
+"""
+
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+
+BACKOFF_POLICIES = ("fixed", "exponential", "decorrelated")
+
+
+class RetryStats:
+    """Retry counters for one function."""
+
+    __slots__ = ("calls", "attempts", "retries", "successes", "failures",
+                 "deadline_hits", "slept", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.successes = 0
+        self.failures = 0
+        self.deadline_hits = 0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        """Add to several counters at once."""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self):
+        """Counters as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__[:-1]}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"RetryStats({fields})"
+
+
+retry_metrics = {}
+
+
+def policy_delays(delay, policy="fixed", max_delay=30.0):
+    """
+    Yield the sleep before each retry.
+
+    Args:
+        delay: Base delay in seconds
+        policy: "fixed" (always delay), "exponential" (delay, 2*delay,
+            4*delay, ...) or "decorrelated" (random between delay and
+            three times the previous sleep, so clients that failed
+            together don't retry together)
+        max_delay: Upper bound for any single sleep
+
+    Raises:
+        ValueError: If policy is not a known policy
+    """
+    if policy not in BACKOFF_POLICIES:
+        raise ValueError(f"policy must be one of {BACKOFF_POLICIES}")
+
+    sleep = delay
+    while True:
+        if policy == "fixed":
+            yield min(delay, max_delay)
+        elif policy == "exponential":
+            yield min(sleep, max_delay)
+            sleep *= 2
+        else:
+            sleep = min(max_delay, random.uniform(delay, sleep * 3))
+            yield sleep
+
+
+def retry(max_attempts=3, delay=1, *, policy="fixed", max_delay=30.0,
+          retry_on=(Exception,), deadline=None, verbose=False):
+    """
+    Retry a function (regular or async) on failure.
+
+    Args:
+        max_attempts: Maximum number of attempts
+        delay: Base delay between attempts in seconds
+        policy: Backoff policy, "fixed", "exponential" or "decorrelated"
+            (named policy rather than backoff because resilience.py's
+            retry_call uses backoff for the growth multiplier)
+        max_delay: Upper bound for one delay
+        retry_on: Exception types worth retrying; anything else is
+            raised immediately
+        deadline: Seconds after the first attempt beyond which no retry
+            starts, or None
+        verbose: Print each failure and delay (for demos)
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+    if policy not in BACKOFF_POLICIES:
+        raise ValueError(f"policy must be one of {BACKOFF_POLICIES}")
+
+    def decorator(func):
+        # Each decorated function counts on its own; decorating again
+        # replaces the registry entry rather than adding to it
+        stats = RetryStats()
+        retry_metrics[f"{func.__module__}.{func.__qualname__}"] = stats
+
+        def next_delay(attempt, error, delays, started):
+            """Seconds to sleep before the next attempt, or None to give up."""
+            if attempt == max_attempts:
+                if verbose:
+                    print(f" All {max_attempts} attempts failed")
+                stats.add(failures=1)
+                return None
+
+            pause = next(delays)
+            if deadline is not None and time.monotonic() - started + pause > deadline:
+                if verbose:
+                    print(f" Deadline of {deadline}s reached after {attempt} attempts")
+                stats.add(failures=1, deadline_hits=1)
+                return None
+
+            if verbose:
+                print(f"  Attempt {attempt} failed: {error}")
+                print(f" Retrying in {pause:.2f} seconds...")
+            stats.add(retries=1, slept=pause)
+            return pause
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                stats.add(calls=1)
+                delays = policy_delays(delay, policy, max_delay)
+                started = time.monotonic()
+                for attempt in range(1, max_attempts + 1):
+                    stats.add(attempts=1)
+                    try:
+                        result = await func(*args, **kwargs)
+                    except retry_on as e:
+                        pause = next_delay(attempt, e, delays, started)
+                        if pause is None:
+                            raise
+                    except BaseException:
+                        stats.add(failures=1)  # not retryable
+                        raise
+                    else:
+                        stats.add(successes=1)
+                        return result
+                    try:
+                        await asyncio.sleep(pause)
+                    except BaseException:
+                        stats.add(failures=1)  # interrupted while waiting
+                        raise
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                stats.add(calls=1)
+                delays = policy_delays(delay, policy, max_delay)
+                started = time.monotonic()
+                for attempt in range(1, max_attempts + 1):
+                    stats.add(attempts=1)
+                    try:
+                        result = func(*args, **kwargs)
+                    except retry_on as e:
+                        pause = next_delay(attempt, e, delays, started)
+                        if pause is None:
+                            raise
+                    except BaseException:
+                        stats.add(failures=1)  # not retryable
+                        raise
+                    else:
+                        stats.add(successes=1)
+                        return result
+                    try:
+                        time.sleep(pause)
+                    except BaseException:
+                        stats.add(failures=1)  # interrupted while waiting
+                        raise
+
+        wrapper.retry_stats = stats
+        return wrapper
+
+    return decorator
@@ -0,0 +1,207 @@
+# Type Checking Decorator - Day 11 Practice Project
+# Check arguments against annotations, compiled once per function
+
+"""
+Runtime type checks driven by annotations.
+
+validate_types(int, int) in the showcase takes the expected types as
+decorator arguments, only looks at positional arguments and zips them
+on every call. typechecked reads the annotations once when the function
+is decorated and keeps, per parameter, a ready-made isinstance() tuple:
+
+    @typechecked
+    def scale(value: float, factor: int = 2, label: Optional[str] = None): ...
+
+Positional, keyword, *args and **kwargs parameters are checked.
+Optional[X], Union[X, Y] and X | Y become tuples of classes, generics
+such as list[int] are checked as list, and Any or unsupported
+annotations are skipped, as are forward references that never
+resolve (e.g. to a class local to another function). As in type
+checkers, int is accepted for float and complex.
+
+When checks are disabled (set_enabled(False), TYPE_CHECKS=0 in the
+environment, or python -O), typechecked returns the function itself,
+so production code pays nothing. The switch applies to functions
+decorated after it is flipped.
+"""
+
+import functools
+import inspect
+import os
+import types
+import typing
+
+enabled = __debug__ and os.environ.get("TYPE_CHECKS", "1") != "0"
+
+_NUMERIC_TOWER = {float: (float, int), complex: (complex, float, int)}
+
+
+def set_enabled(value):
+    """Turn checking on or off for functions decorated from now on."""
+    global enabled
+    enabled = bool(value)
+
+
+def _classes_for(annotation):
+    """isinstance() tuple for an annotation, or None if it can't be checked."""
+    if annotation is None or annotation is type(None):
+        return (type(None),)
+    if annotation is typing.Any:
+        return None
+
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        classes = []
+        for member in typing.get_args(annotation):
+            member_classes = _classes_for(member)
+            if member_classes is None:
+                return None  # Union containing Any accepts everything
+            classes.extend(member_classes)
+        return tuple(dict.fromkeys(classes))
+    if origin is not None:
+        return (origin,) if isinstance(origin, type) else None
+    if isinstance(annotation, type):
+        return _NUMERIC_TOWER.get(annotation, (annotation,))
+    return None
+
+
+def _describe(classes):
+    """Readable name for an isinstance() tuple: "int or None"."""
+    implied = {narrower for cls in classes if cls in _NUMERIC_TOWER
+               for narrower in _NUMERIC_TOWER[cls][1:]}
+    names = ["None" if cls is type(None) else cls.__name__
+             for cls in classes if cls not in implied]
+    return " or ".join(names)
+
+
+def _type_hints(func):
+    """
+    Resolved annotations of func.
+
+    An annotation naming something that doesn't exist (a class defined
+    later, or local to another function) is left out instead of raising.
+    """
+    try:
+        return typing.get_type_hints(func)
+    except NameError:
+        pass
+    namespace = getattr(inspect.unwrap(func), "__globals__", {})
+    hints = {}
+    for name, annotation in func.__annotations__.items():
+        def probe():
+            pass
+        probe.__annotations__ = {name: annotation}
+        try:
+            hints.update(typing.get_type_hints(probe, globalns=namespace))
+        except NameError:
+            continue
+    return hints
+
+
+def _compile(func, hints):
+    """
+    Build the argument check for func, or None if nothing can be checked.
+
+    The returned check(args, kwargs) raises TypeError on a mismatch.
+    """
+    signature = inspect.signature(func)
+
+    positional = []   # (index, name, classes) for annotated positional params
+    by_name = {}      # name -> classes for params that may be passed by keyword
+    var_positional = var_keyword = None
+
+    for index, param in enumerate(signature.parameters.values()):
+        classes = _classes_for(hints[param.name]) if param.name in hints else None
+        if param.kind is param.VAR_POSITIONAL:
+            var_positional = (index, param.name, classes)
+            continue
+        if param.kind is param.VAR_KEYWORD:
+            var_keyword = (param.name, classes)
+            continue
+        if classes is None:
+            continue
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            positional.append((index, param.name, classes))
+        if param.kind is not param.POSITIONAL_ONLY:
+            by_name[param.name] = classes
+
+    if var_positional is not None and var_positional[2] is None:
+        var_positional = None
+    if var_keyword is not None and var_keyword[1] is None:
+        var_keyword = None
+
+    if not positional and not by_name and not var_positional and not var_keyword:
+        return None
+
+    qualname = func.__qualname__
+    named = set(signature.parameters)
+
+    def fail(name, classes, value):
+        raise TypeError(
+            f"{qualname}() argument '{name}': expected {_describe(classes)}, "
+            f"got {type(value).__name__}"
+        )
+
+    def check(args, kwargs):
+        count = len(args)
+        for index, name, classes in positional:
+            if index >= count:
+                break
+            if not isinstance(args[index], classes):
+                fail(name, classes, args[index])
+
+        if var_positional is not None:
+            start, name, classes = var_positional
+            for value in args[start:]:
+                if not isinstance(value, classes):
+                    fail(f"*{name}", classes, value)
+
+        for name, value in kwargs.items():
+            classes = by_name.get(name)
+            if classes is None:
+                if var_keyword is None or name in named:
+                    continue
+                classes = var_keyword[1]
+            if not isinstance(value, classes):
+                fail(name, classes, value)
+
+    return check
+
+
+_UNRESOLVED = object()
+
+
+def typechecked(func):
+    """
+    Check call arguments against func's annotations.
+
+    Annotations are resolved when func is decorated. If one refers to a
+    name that doesn't exist yet (say, the class the method belongs to),
+    resolution waits for the first call, and annotations that still
+    can't be resolved then are not checked.
+
+    Raises:
+        TypeError: At call time, naming the first argument whose value
+            doesn't match its annotation
+    """
+    if not enabled:
+        return func
+
+    try:
+        check = _compile(func, typing.get_type_hints(func))
+    except NameError:
+        check = _UNRESOLVED
+    else:
+        if check is None:
+            return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal check
+        if check is _UNRESOLVED:
+            check = _compile(func, _type_hints(func))
+        if check is not None:
+            check(args, kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,379 @@
+# Benchmark Harness - Day 12 Practice Project
+# Measure how the recursion examples scale with input size
+
+"""
+Benchmark subsystem for the Day 12 algorithms.
+
+Every algorithm is timed across several input sizes with
+time.perf_counter_ns, after warmup runs and with garbage collection
+paused (like timeit). Each size reports min, median, p95 and max, and
+each algorithm gets a growth-rate fit against common complexity
+classes.
+
+Run from the command line:
+    python benchmark.py                      # all algorithms, text table
+    python benchmark.py gcd hanoi --json out.json
+    python benchmark.py --search 10000000    # batch search vs bisect
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import random
+import time
+from bisect import bisect_left
+
+import recursion_visualizer as rv
+from flatten import flatten, make_chain, make_tree
+from search import EytzingerIndex, find, search_many
+
+# ===== MEASUREMENT =====
+
+def measure(func, args=(), repeats=5, warmup=1, max_seconds=None):
+    """
+    Time func(*args) several times.
+
+    Args:
+        func: Function to time
+        args: Positional arguments, built before timing starts
+        repeats: Number of timed runs
+        warmup: Untimed runs first (warms caches and the allocator)
+        max_seconds: Stop repeating once this much time is spent
+            (at least one sample is always taken)
+
+    Returns:
+        List of durations in nanoseconds
+
+    Raises:
+        ValueError: If repeats is less than 1
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+
+    for _ in range(warmup):
+        func(*args)
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        budget_ns = None if max_seconds is None else int(max_seconds * 1e9)
+        spent = 0
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            func(*args)
+            elapsed = time.perf_counter_ns() - start
+            samples.append(elapsed)
+            spent += elapsed
+            if budget_ns is not None and spent >= budget_ns:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return samples
+
+
+def percentile(sorted_samples, fraction):
+    """Percentile by linear interpolation on pre-sorted samples."""
+    if not sorted_samples:
+        raise ValueError("No samples")
+    position = (len(sorted_samples) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    weight = position - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def summarize(samples):
+    """Summary statistics (nanoseconds) for a list of samples."""
+    if not samples:
+        raise ValueError("No samples")
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "min_ns": ordered[0],
+        "median_ns": percentile(ordered, 0.5),
+        "p95_ns": percentile(ordered, 0.95),
+        "max_ns": ordered[-1],
+    }
+
+
+# ===== GROWTH-RATE FITTING =====
+
+def _log2_at_least_one(n):
+    """log2(n), clamped so log-of-log models stay defined at n <= 2."""
+    return max(math.log2(n), 1.0)
+
+
+# Natural log of each model's growth function, so 2^n and n! cannot overflow
+GROWTH_MODELS = {
+    "O(1)": lambda n: 0.0,
+    "O(log n)": lambda n: math.log(_log2_at_least_one(n)),
+    "O(n)": lambda n: math.log(n),
+    "O(n log n)": lambda n: math.log(n) + math.log(_log2_at_least_one(n)),
+    "O(n^2)": lambda n: 2 * math.log(n),
+    "O(n^3)": lambda n: 3 * math.log(n),
+    "O(2^n)": lambda n: n * math.log(2),
+    "O(n!)": lambda n: math.lgamma(n + 1),
+}
+
+
+def fit_growth(sizes, times):
+    """
+    Fit measured times against common complexity classes.
+
+    For each model f, the best constant c in t = c * f(n) is found in
+    log space, and the model with the smallest residual wins. The slope
+    of log(t) against log(n) is reported too, as an empirical exponent.
+
+    Returns:
+        Dict with 'best_fit', 'exponent' and per-model 'residuals'
+    """
+    points = [(n, t) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return {"best_fit": None, "exponent": None, "residuals": {}}
+
+    log_t = [math.log(t) for _, t in points]
+    residuals = {}
+    for name, log_model in GROWTH_MODELS.items():
+        diffs = [lt - log_model(n) for lt, (n, _) in zip(log_t, points)]
+        offset = sum(diffs) / len(diffs)
+        residuals[name] = sum((d - offset) ** 2 for d in diffs) / len(diffs)
+
+    log_n = [math.log(n) for n, _ in points]
+    mean_n = sum(log_n) / len(log_n)
+    mean_t = sum(log_t) / len(log_t)
+    spread = sum((x - mean_n) ** 2 for x in log_n)
+    exponent = None
+    if spread > 0:
+        exponent = sum((x - mean_n) * (y - mean_t)
+                       for x, y in zip(log_n, log_t)) / spread
+
+    return {
+        "best_fit": min(residuals, key=residuals.get) if residuals else None,
+        "exponent": exponent,
+        "residuals": residuals,
+    }
+
+
+# ===== ALGORITHM SUITES =====
+
+def _quiet(func):
+    """Wrap func so anything it prints goes to /dev/null."""
+    def run(*args):
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            return func(*args)
+    return run
+
+
+def _fibonacci_pair(n):
+    """Consecutive Fibonacci numbers, the worst case for Euclid's GCD."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return b, a
+
+
+# name -> (function, input builder, sizes)
+# Builders run outside the timed region. Sizes stay below the
+# recursion limit and keep the exponential algorithms short.
+SUITES = {
+    "fibonacci": (rv.fibonacci_recursive, lambda n: (n,), [10, 14, 18, 22]),
+    "permutations": (rv.permutations, lambda n: ("abcdefghij"[:n],), [4, 5, 6, 7, 8]),
+    "hanoi": (_quiet(rv.hanoi), lambda n: (n,), [4, 6, 8, 10, 12]),
+    "binary_search": (
+        rv.binary_search,
+        lambda n: (list(range(0, 2 * n, 2)), 2 * random.randrange(n)),
+        [1_000, 10_000, 100_000, 1_000_000],
+    ),
+    "flatten_list": (
+        rv.flatten_list,
+        lambda n: ([[i, [i + 1, [i + 2]]] for i in range(0, n, 3)],),
+        [1_000, 10_000, 100_000],
+    ),
+    "flatten_tree": (flatten, lambda n: (make_tree(n),), [10_000, 100_000, 1_000_000]),
+    "flatten_chain": (flatten, lambda n: (make_chain(n),), [1_000, 10_000, 100_000]),
+    "sum_list": (rv.sum_list, lambda n: (list(range(n)),), [1_000, 10_000, 100_000, 1_000_000]),
+    "reverse_string": (rv.reverse_string, lambda n: ("x" * n,), [1_000, 10_000, 100_000, 1_000_000]),
+    "is_palindrome": (rv.is_palindrome, lambda n: ("a" * n,), [1_000, 10_000, 100_000, 1_000_000]),
+    "gcd": (rv.gcd, _fibonacci_pair, [10, 50, 100, 500, 900]),
+}
+
+
+def run_benchmark(name, sizes=None, repeats=7, warmup=1, max_seconds=2.0):
+    """
+    Benchmark one algorithm across input sizes.
+
+    Returns:
+        Dict with per-size statistics and a growth fit
+    """
+    func, build_input, default_sizes = SUITES[name]
+    sizes = default_sizes if sizes is None else sizes
+
+    points = []
+    for size in sizes:
+        args = build_input(size)
+        stats = summarize(measure(func, args, repeats, warmup, max_seconds))
+        stats["size"] = size
+        points.append(stats)
+
+    growth = fit_growth([p["size"] for p in points],
+                        [p["median_ns"] for p in points])
+    return {"name": name, "points": points, "growth": growth}
+
+
+def run_benchmarks(names=None, repeats=7, warmup=1, max_seconds=2.0):
+    """Benchmark several algorithms (all of them by default)."""
+    names = list(SUITES) if not names else names
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return [run_benchmark(name, repeats=repeats, warmup=warmup,
+                          max_seconds=max_seconds) for name in names]
+
+
+# ===== SEARCH COMPARISON =====
+
+def _bisect_find_all(arr, targets):
+    """Baseline: the standard library's bisect for every target."""
+    n = len(arr)
+    results = []
+    for target in targets:
+        i = bisect_left(arr, target)
+        results.append(i if i < n and arr[i] == target else -1)
+    return results
+
+
+def _find_all(arr, targets):
+    """search.find for every target."""
+    return [find(arr, target) for target in targets]
+
+
+def run_search_comparison(sizes=(100_000, 1_000_000, 10_000_000), queries=100_000,
+                          repeats=3, warmup=1, max_seconds=10.0):
+    """
+    Compare batch lookups against bisect on large sorted arrays.
+
+    Every method answers the same random queries (about half of them
+    present). Building arrays and the Eytzinger index is not timed.
+
+    Returns:
+        Results in the same shape as run_benchmarks, one per method
+    """
+    methods = {
+        "bisect": [],
+        "search.find": [],
+        "search_many": [],
+        "eytzinger": [],
+    }
+
+    for size in sizes:
+        arr = list(range(0, 2 * size, 2))
+        targets = [random.randrange(2 * size) for _ in range(queries)]
+        index = EytzingerIndex(arr, 'q')
+
+        runs = {
+            "bisect": (_bisect_find_all, (arr, targets)),
+            "search.find": (_find_all, (arr, targets)),
+            "search_many": (search_many, (arr, targets)),
+            "eytzinger": (index.find_many, (targets,)),
+        }
+        for name, (func, args) in runs.items():
+            stats = summarize(measure(func, args, repeats, warmup, max_seconds))
+            stats["size"] = size
+            stats["queries"] = queries
+            methods[name].append(stats)
+
+    return [
+        {
+            "name": name,
+            "points": points,
+            "growth": fit_growth([p["size"] for p in points],
+                                 [p["median_ns"] for p in points]),
+        }
+        for name, points in methods.items()
+    ]
+
+
+# ===== REPORTING =====
+
+def format_duration(ns):
+    """Human-readable duration from nanoseconds."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def format_table(results):
+    """Render benchmark results as a text table."""
+    lines = []
+    header = f"{'Algorithm':<16} {'Size':>10} {'Runs':>5} {'Median':>11} {'p95':>11}"
+    for result in results:
+        lines.append("=" * len(header))
+        lines.append(header)
+        lines.append("-" * len(header))
+        for point in result["points"]:
+            lines.append(
+                f"{result['name']:<16} {point['size']:>10,} {point['runs']:>5} "
+                f"{format_duration(point['median_ns']):>11} "
+                f"{format_duration(point['p95_ns']):>11}"
+            )
+        growth = result["growth"]
+        if growth["best_fit"] is not None:
+            exponent = growth["exponent"]
+            slope = "" if exponent is None else f" (log-log slope {exponent:.2f})"
+            lines.append(f"Growth: {growth['best_fit']}{slope}")
+    lines.append("=" * len(header) if lines else "No results")
+    return "\n".join(lines)
+
+
+def to_json(results, indent=2):
+    """Serialize benchmark results to a JSON string."""
+    return json.dumps({
+        "timer": "perf_counter_ns",
+        "results": results,
+    }, indent=indent)
+
+
+def _at_least_one(text):
+    """argparse type for counts that must be 1 or more."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Day 12 algorithms")
+    parser.add_argument("names", nargs="*", help=f"Algorithms: {', '.join(SUITES)}")
+    parser.add_argument("--repeat", type=_at_least_one, default=7, help="Timed runs per size")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per size")
+    parser.add_argument("--json", metavar="FILE", help="Also write results as JSON")
+    parser.add_argument("--search", type=int, metavar="N",
+                        help="Instead, compare batch search methods on arrays up to N")
+    parser.add_argument("--queries", type=int, default=100_000,
+                        help="Lookups per run for --search")
+    args = parser.parse_args(argv)
+
+    if args.search:
+        sizes = [size for size in (100_000, 1_000_000, 10_000_000) if size < args.search]
+        results = run_search_comparison(sizes + [args.search], args.queries,
+                                        repeats=args.repeat, warmup=args.warmup)
+    else:
+        results = run_benchmarks(args.names, repeats=args.repeat, warmup=args.warmup)
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            file.write(to_json(results))
+        print(f"\n✓ Results written to '{args.json}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+# Call Tracing - Day 12 Practice Project
+# Record recursion trees first, render or export them afterwards
+
+"""
+Recorded call-tree tracing for recursive functions.
+
+countdown_visual, factorial_visual and fibonacci_visual print on every
+frame, so fib(25) means hundreds of thousands of terminal writes. Here
+a run only appends to compact arrays:
+
+    kinds       - CALL or RETURN per event
+    depths      - recursion depth per event
+    timestamps  - perf_counter_ns per event
+    values      - the call's (name, args), or the returned value
+
+render() then walks the recording once and builds the text in memory,
+collapsing subtrees that repeat an earlier call with the same
+arguments. to_chrome_trace() exports the same events in Chrome's
+trace-event format (open in chrome://tracing or ui.perfetto.dev).
+
+Usage:
+    result, trace = record(fibonacci, 20)
+    print(render(trace))
+
+record_countdown() and record_factorial() build the same recordings
+iteratively, so linear chains thousands of calls deep can be shown.
+"""
+
+import functools
+import json
+import reprlib
+import time
+from array import array
+
+CALL = 1
+RETURN = 0
+
+_active = None
+
+
+class CallTrace:
+    """In-memory buffer of call and return events."""
+
+    def __init__(self):
+        self.kinds = array('B')
+        self.depths = array('I')
+        self.timestamps = array('q')
+        self.values = []
+        self.depth = 0
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def enter(self, name, args):
+        """Record a call and go one level deeper."""
+        self.kinds.append(CALL)
+        self.depths.append(self.depth)
+        self.timestamps.append(time.perf_counter_ns())
+        self.values.append((name, args))
+        self.depth += 1
+
+    def leave(self, result):
+        """Come back up one level and record the returned value."""
+        self.depth -= 1
+        self.kinds.append(RETURN)
+        self.depths.append(self.depth)
+        self.timestamps.append(time.perf_counter_ns())
+        self.values.append(result)
+
+    @property
+    def call_count(self):
+        """Number of calls recorded."""
+        return self.kinds.count(CALL)
+
+    @property
+    def max_depth(self):
+        """Deepest recursion level reached (0 = top-level call)."""
+        return max(self.depths, default=0)
+
+    def matching_returns(self):
+        """List mapping each CALL event index to its RETURN event index."""
+        matches = [0] * len(self.kinds)
+        open_calls = []
+        for index, kind in enumerate(self.kinds):
+            if kind == CALL:
+                open_calls.append(index)
+            else:
+                matches[open_calls.pop()] = index
+        return matches
+
+
+def traced(func):
+    """
+    Record calls to func while a trace is active.
+
+    With no active trace the wrapper only checks one global and calls
+    straight through. Decorate the recursive function itself so its
+    inner calls are recorded too.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        trace = _active
+        if trace is None:
+            return func(*args)
+
+        trace.enter(name, args)
+        try:
+            result = func(*args)
+        except BaseException as e:
+            trace.leave(e)
+            raise
+        trace.leave(result)
+        return result
+
+    return wrapper
+
+
+def record(func, *args):
+    """
+    Run func(*args) with a fresh trace active.
+
+    Returns:
+        (result, CallTrace)
+    """
+    global _active
+    previous = _active
+    trace = CallTrace()
+    _active = trace
+    try:
+        result = func(*args)
+    finally:
+        _active = previous
+    return result, trace
+
+
+# ===== TRACEABLE EXAMPLES =====
+
+@traced
+def countdown(n):
+    """Count down to zero."""
+    if n <= 0:
+        return None
+    return countdown(n - 1)
+
+
+@traced
+def factorial(n):
+    """n! computed recursively."""
+    if n <= 1:
+        return 1
+    return n * factorial(n - 1)
+
+
+@traced
+def fibonacci(n):
+    """Naive tree-recursive Fibonacci."""
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+
+# ===== LINEAR CHAINS =====
+
+def _record_chain(name, chain, base_result, combine):
+    """
+    Record a linear recursion (one inner call per frame) without recursing.
+
+    The traced wrapper adds a Python frame per level, so record() on a
+    deep linear chain hits the recursion limit long before the plain
+    function would. Here the calls in chain are entered in order and
+    left in reverse, with combine(arg, inner_result) giving each
+    frame's return value.
+    """
+    trace = CallTrace()
+    for arg in chain:
+        trace.enter(name, (arg,))
+    result = base_result
+    for arg in reversed(chain[:-1]):
+        trace.leave(result)
+        result = combine(arg, result)
+    trace.leave(result)
+    return result, trace
+
+
+def record_countdown(n):
+    """Same recording as record(countdown, n), for any n."""
+    chain = list(range(n, -1, -1)) if n > 0 else [n]
+    return _record_chain("countdown", chain, None, lambda arg, inner: None)
+
+
+def record_factorial(n):
+    """Same recording as record(factorial, n), for any n."""
+    chain = list(range(n, 0, -1)) if n > 1 else [n]
+    return _record_chain("factorial", chain, 1, lambda arg, inner: arg * inner)
+
+
+# ===== RENDERING =====
+
+def _digit_count(value):
+    """Decimal digits in an int, without converting it to a string."""
+    value = abs(value)
+    digits = int(value.bit_length() * 0.30102999566398)  # log10(2)
+    return digits + (value >= 10 ** digits)
+
+
+class _ShortRepr(reprlib.Repr):
+    """reprlib.Repr that shows long ints as a digit count."""
+
+    def repr_int(self, x, level):
+        # repr() of a huge int is slow and, past sys.get_int_max_str_digits(),
+        # raises ValueError; reprlib would cut it down to maxlong anyway
+        if x.bit_length() > 4 * self.maxlong:
+            return f"<{_digit_count(x):,} digits>"
+        return super().repr_int(x, level)
+
+
+_short = _ShortRepr()
+_short.maxlong = 30
+
+
+def short_repr(value):
+    """repr() bounded in length: long ints become "<N digits>"."""
+    return _short.repr(value)
+
+
+def _format_call(name, args):
+    """Label a call like the visualizers do: name(arg1, arg2)."""
+    return f"{name}({', '.join(short_repr(arg) for arg in args)})"
+
+
+def render(trace, collapse=True, max_lines=None):
+    """
+    Render a recorded trace as indented text in one pass.
+
+    Args:
+        trace: CallTrace from record()
+        collapse: Show a repeated call (same function and arguments as
+            an earlier completed call) on one line instead of its subtree
+        max_lines: Stop after this many lines
+
+    Returns:
+        The rendered text
+    """
+    kinds = trace.kinds
+    depths = trace.depths
+    values = trace.values
+    matches = trace.matching_returns() if collapse else None
+    seen = {}
+    lines = []
+
+    index = 0
+    total = len(kinds)
+    while index < total:
+        if max_lines is not None and len(lines) >= max_lines:
+            lines.append(f"... ({total - index:,} more events)")
+            break
+
+        indent = "  " * depths[index]
+
+        if kinds[index] == RETURN:
+            lines.append(f"{indent}← Returning {short_repr(values[index])}")
+            index += 1
+            continue
+
+        label = _format_call(*values[index])
+        if collapse:
+            end = matches[index]
+            calls = (end - index + 1) // 2
+            key = values[index]
+            try:
+                repeated = key in seen
+                seen[key] = True
+            except TypeError:
+                repeated = False  # unhashable arguments are never collapsed
+            if repeated:
+                lines.append(f"{indent}↺ {label} = {short_repr(values[end])} "
+                             f"(same as before, {calls:,} calls skipped)")
+                index = end + 1
+                continue
+
+        lines.append(f"{indent}→ {label}")
+        index += 1
+
+    return "\n".join(lines)
+
+
+# ===== CHROME TRACE EXPORT =====
+
+def iter_chrome_events(trace, pid=1, tid=1):
+    """Yield trace events as Chrome trace-event dicts (B/E pairs)."""
+    start = trace.timestamps[0] if len(trace) else 0
+    open_names = []
+    for kind, timestamp, value in zip(trace.kinds, trace.timestamps, trace.values):
+        ts = (timestamp - start) / 1000  # microseconds
+        if kind == CALL:
+            name = _format_call(*value)
+            open_names.append(name)
+            yield {"name": name, "ph": "B", "ts": ts, "pid": pid, "tid": tid}
+        else:
+            yield {"name": open_names.pop(), "ph": "E", "ts": ts, "pid": pid,
+                   "tid": tid, "args": {"result": short_repr(value)}}
+
+
+def to_chrome_trace(trace):
+    """Trace as a Chrome trace-event JSON object."""
+    return {"traceEvents": list(iter_chrome_events(trace)),
+            "displayTimeUnit": "ns"}
+
+
+def write_chrome_trace(trace, filename):
+    """
+    Write the trace as Chrome trace-event JSON, one event at a time.
+
+    Returns:
+        Number of events written
+    """
+    count = 0
+    with open(filename, 'w', buffering=1024 * 1024) as file:
+        file.write('{"displayTimeUnit": "ns", "traceEvents": [\n')
+        for event in iter_chrome_events(trace):
+            if count:
+                file.write(",\n")
+            file.write(json.dumps(event))
+            count += 1
+        file.write("\n]}\n")
+    return count
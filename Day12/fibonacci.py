@@ -0,0 +1,136 @@
+# Fibonacci Engine - Day 12 Practice Project
+# O(log n) Fibonacci numbers without recursion limits
+
+"""
+Fast Fibonacci algorithms.
+
+fibonacci_recursive, fibonacci_iterative and fibonacci_memoized in
+recursion_visualizer take O(2^n), O(n) and O(n) steps, and the
+memoized one hits the recursion limit around n = 1000. The functions
+here need only O(log n) big-integer multiplications and no recursion,
+so n = 10**6 and beyond is practical.
+
+Fast doubling uses the identities
+    F(2k)   = F(k) * (2*F(k+1) - F(k))
+    F(2k+1) = F(k)^2 + F(k+1)^2
+"""
+
+
+def _check_index(n):
+    """Reject negative or non-integer indices."""
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("Fibonacci index must be an integer")
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+
+
+def fib_pair(n, m=None):
+    """
+    Return (F(n), F(n+1)) by fast doubling, optionally modulo m.
+
+    Walks the bits of n from the most significant one, doubling the
+    index at each step and adding one when the bit is set.
+    """
+    _check_index(n)
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if m is not None:
+            c %= m
+            d %= m
+        if bit == '1':
+            a, b = d, c + d
+            if m is not None:
+                b %= m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast_doubling(n):
+    """Fibonacci number F(n) in O(log n) multiplications."""
+    return fib_pair(n)[0]
+
+
+def _matrix_multiply(x, y, m=None):
+    """Multiply two 2x2 matrices stored as (a, b, c, d) tuples."""
+    a = x[0] * y[0] + x[1] * y[2]
+    b = x[0] * y[1] + x[1] * y[3]
+    c = x[2] * y[0] + x[3] * y[2]
+    d = x[2] * y[1] + x[3] * y[3]
+    if m is not None:
+        return (a % m, b % m, c % m, d % m)
+    return (a, b, c, d)
+
+
+def fib_matrix(n, m=None):
+    """
+    Fibonacci number F(n) by matrix exponentiation.
+
+    [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]], computed with
+    iterative square-and-multiply.
+    """
+    _check_index(n)
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _matrix_multiply(result, base, m)
+        base = _matrix_multiply(base, base, m)
+        n >>= 1
+    return result[1] if m is None else result[1] % m
+
+
+def fib_mod(n, m):
+    """
+    F(n) modulo m, keeping every intermediate value below m^2.
+
+    Raises:
+        ValueError: If m is not positive
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+    return fib_pair(n, m)[0] % m
+
+
+def fib_batch(indices, m=None):
+    """
+    Fibonacci numbers for many indices at once.
+
+    Small indices are filled in by a single linear sweep up to the
+    largest of them; large ones each use fast doubling.
+
+    Args:
+        indices: Iterable of non-negative integers
+        m: Optional modulus
+
+    Returns:
+        Dict mapping each distinct index to F(index) (mod m)
+    """
+    wanted = sorted(set(indices))
+    for n in wanted:
+        _check_index(n)
+
+    # A linear sweep costs about one addition per index; fast doubling
+    # costs a few multiplications per bit. Sweep the small ones.
+    sweep_limit = 1000
+    results = {}
+
+    small = [n for n in wanted if n <= sweep_limit]
+    if small:
+        a, b = 0, 1
+        position = 0
+        for n in small:
+            while position < n:
+                a, b = b, a + b
+                if m is not None:
+                    b %= m
+                position += 1
+            results[n] = a if m is None else a % m
+
+    for n in wanted:
+        if n > sweep_limit:
+            results[n] = fib_pair(n, m)[0] if m is None else fib_mod(n, m)
+
+    return results
@@ -0,0 +1,96 @@
+# Flatten Engine - Day 12 Practice Project
+# Flatten arbitrarily deep and large nested data with an explicit stack
+
+"""
+Iterative, generator-based flattening shared by Day 10 and Day 12.
+
+The recursive flatten_list versions raise RecursionError around 1000
+levels of nesting and copy every sub-list into its parent with extend.
+iter_flatten keeps its own stack of iterators instead, so depth is
+limited only by memory and each leaf is yielded exactly once.
+
+Strings, bytes and bytearrays are iterable but are treated as leaves;
+otherwise "abc" would flatten into "a", "b", "c" forever.
+"""
+
+from collections.abc import Iterable
+
+ATOMIC_TYPES = (str, bytes, bytearray)
+
+
+def iter_flatten(data, max_depth=None, flatten_types=None, atomic_types=ATOMIC_TYPES):
+    """
+    Yield the leaves of a nested structure in order.
+
+    Args:
+        data: Any iterable, possibly nested
+        max_depth: Levels of nesting to expand below data, or None for
+            all; containers deeper than this are yielded as-is
+        flatten_types: Only expand instances of these types (e.g.
+            (list,)); by default any iterable is expanded
+        atomic_types: Iterable types that are never expanded
+
+    Raises:
+        ValueError: If a container (directly or indirectly) contains itself
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must be non-negative")
+
+    expandable = {}
+
+    def should_expand(item):
+        # isinstance against ABCs is slow; cache the answer per type
+        item_type = type(item)
+        answer = expandable.get(item_type)
+        if answer is None:
+            if isinstance(item, atomic_types):
+                answer = False
+            elif flatten_types is not None:
+                answer = isinstance(item, flatten_types)
+            else:
+                answer = isinstance(item, Iterable)
+            expandable[item_type] = answer
+        return answer
+
+    stack = [iter(data)]
+    open_ids = [id(data)]
+    open_set = {id(data)}
+    depth_limit = float('inf') if max_depth is None else max_depth
+
+    while stack:
+        for item in stack[-1]:
+            if len(stack) <= depth_limit and should_expand(item):
+                item_id = id(item)
+                if item_id in open_set:
+                    raise ValueError("Cannot flatten a structure that contains itself")
+                stack.append(iter(item))
+                open_ids.append(item_id)
+                open_set.add(item_id)
+                break
+            yield item
+        else:
+            stack.pop()
+            open_set.discard(open_ids.pop())
+
+
+def flatten(data, max_depth=None, flatten_types=None, atomic_types=ATOMIC_TYPES):
+    """Flatten nested data into a list (see iter_flatten for options)."""
+    return list(iter_flatten(data, max_depth, flatten_types, atomic_types))
+
+
+# ===== TEST DATA =====
+
+def make_tree(size, branching=4):
+    """Nested lists holding the numbers 0 .. size-1 in a balanced tree."""
+    level = list(range(size))
+    while len(level) > branching:
+        level = [level[i:i + branching] for i in range(0, len(level), branching)]
+    return level
+
+
+def make_chain(depth):
+    """A list nested depth levels deep: [0, [1, [2, ...]]]."""
+    chain = []
+    for value in range(depth - 1, -1, -1):
+        chain = [value, chain] if chain else [value]
+    return chain
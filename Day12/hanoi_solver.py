@@ -0,0 +1,151 @@
+# Tower of Hanoi Solver - Day 12 Practice Project
+# Stream millions of moves without recursion or terminal output
+
+"""
+Iterative Tower of Hanoi using the binary (bit-trick) solution.
+
+Numbering moves m = 1 .. 2^n - 1, move m
+    - moves disk (m & -m).bit_length(), the lowest set bit of m
+    - goes from peg (m & (m - 1)) % 3 to peg ((m | (m - 1)) + 1) % 3
+
+Pegs 0, 1, 2 are mapped to names so that the tower always ends on the
+requested target. Any single move is O(1) to compute and the position
+after k moves is O(n), so puzzles far too big to print (n = 25 has
+33 million moves) can still be analyzed.
+"""
+
+
+def _peg_names(n, source, target, auxiliary):
+    """Peg names indexed by the bit-trick peg numbers 0, 1, 2."""
+    # With an odd number of disks the formula ends on peg 2,
+    # with an even number on peg 1.
+    if n % 2:
+        return (source, auxiliary, target)
+    return (source, target, auxiliary)
+
+
+def _check_disks(n):
+    """Reject a negative disk count."""
+    if n < 0:
+        raise ValueError("Number of disks must be non-negative")
+
+
+def count_moves(n):
+    """Total moves needed for n disks: 2^n - 1."""
+    _check_disks(n)
+    return (1 << n) - 1
+
+
+def moves_per_disk(n):
+    """Dict of disk -> how many times it moves (disk d moves 2^(n-d) times)."""
+    _check_disks(n)
+    return {disk: 1 << (n - disk) for disk in range(1, n + 1)}
+
+
+def kth_move(n, k, source='A', target='C', auxiliary='B'):
+    """
+    Return move number k (1-based) as (disk, from_peg, to_peg).
+
+    Raises:
+        IndexError: If k is not between 1 and 2^n - 1
+    """
+    total = count_moves(n)
+    if not 1 <= k <= total:
+        raise IndexError(f"Move {k} out of range (1..{total})")
+
+    pegs = _peg_names(n, source, target, auxiliary)
+    return (
+        (k & -k).bit_length(),
+        pegs[(k & (k - 1)) % 3],
+        pegs[((k | (k - 1)) + 1) % 3],
+    )
+
+
+def iter_moves(n, source='A', target='C', auxiliary='B', start=1, stop=None):
+    """
+    Yield moves (disk, from_peg, to_peg) in order.
+
+    Args:
+        n: Number of disks
+        start: First move number to yield (1-based)
+        stop: Last move number to yield, default the final move
+    """
+    pegs = _peg_names(n, source, target, auxiliary)
+    stop = count_moves(n) if stop is None else min(stop, count_moves(n))
+
+    for m in range(max(start, 1), stop + 1):
+        yield (
+            (m & -m).bit_length(),
+            pegs[(m & (m - 1)) % 3],
+            pegs[((m | (m - 1)) + 1) % 3],
+        )
+
+
+def state_after(n, k, source='A', target='C', auxiliary='B'):
+    """
+    Return the pegs after the first k moves, in O(n).
+
+    Works from the largest disk down: during the first half of its
+    sub-puzzle a disk stays on its source peg, afterwards it sits on
+    the target, and the smaller disks solve a sub-puzzle accordingly.
+
+    Returns:
+        Dict of peg name -> list of disks, bottom to top
+    """
+    total = count_moves(n)
+    if not 0 <= k <= total:
+        raise IndexError(f"Move count {k} out of range (0..{total})")
+
+    state = {source: [], auxiliary: [], target: []}
+    src, dst, aux = source, target, auxiliary
+
+    for disk in range(n, 0, -1):
+        half = 1 << (disk - 1)
+        if k < half:
+            # Smaller disks are still moving onto the spare peg
+            state[src].append(disk)
+            dst, aux = aux, dst
+        else:
+            # This disk has moved; smaller disks move from spare to target
+            state[dst].append(disk)
+            k -= half
+            src, aux = aux, src
+
+    return state
+
+
+def solve(n, callback, source='A', target='C', auxiliary='B'):
+    """
+    Call callback(disk, from_peg, to_peg) for every move.
+
+    Returns:
+        Number of moves made
+    """
+    count = 0
+    for disk, from_peg, to_peg in iter_moves(n, source, target, auxiliary):
+        callback(disk, from_peg, to_peg)
+        count += 1
+    return count
+
+
+def write_moves(n, file, source='A', target='C', auxiliary='B', batch_size=65536):
+    """
+    Write every move as a text line to an open file, in batches.
+
+    Lines are formatted like hanoi(): "Move disk 1: A → C". Batching
+    keeps the cost to one write call per batch_size moves.
+
+    Returns:
+        Number of moves written
+    """
+    count = 0
+    batch = []
+    for disk, from_peg, to_peg in iter_moves(n, source, target, auxiliary):
+        batch.append(f"Move disk {disk}: {from_peg} → {to_peg}\n")
+        if len(batch) >= batch_size:
+            file.writelines(batch)
+            count += len(batch)
+            batch.clear()
+
+    file.writelines(batch)
+    return count + len(batch)
@@ -0,0 +1,152 @@
+# Number Theory Kernels - Day 12 Practice Project
+# One shared home for GCD, LCM and modular inverse
+
+"""
+GCD/LCM kernels shared by Day 10, Day 12 and Day 16.
+
+    gcd, lcm            - scalar, backed by math.gcd (C speed)
+    binary_gcd          - Stein's algorithm: shifts and subtraction only
+    extended_gcd        - g, x, y with a*x + b*y == g
+    mod_inverse         - x with a*x % m == 1
+    gcd_reduce, lcm_reduce
+                        - fold a whole sequence, stopping early when the
+                          answer can no longer change
+    gcd_array, lcm_array
+                        - elementwise over two arrays; uses NumPy's
+                          ufuncs when NumPy is installed
+
+All results are non-negative, matching math.gcd.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array functions fall back to lists
+    np = None
+
+
+# ===== SCALAR =====
+
+def gcd(a, b):
+    """Greatest common divisor of a and b."""
+    return math.gcd(a, b)
+
+
+def lcm(a, b):
+    """Least common multiple of a and b (0 if either is 0)."""
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math.gcd(a, b) * b)
+
+
+def binary_gcd(a, b):
+    """
+    Greatest common divisor by Stein's binary algorithm.
+
+    Factors of two are stripped with shifts, then the smaller odd
+    number is repeatedly subtracted from the larger one.
+    """
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+
+    # Common power of two, from the lowest set bit of a | b
+    both = a | b
+    shift = (both & -both).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+
+    return a << shift
+
+
+def extended_gcd(a, b):
+    """
+    Extended Euclidean algorithm.
+
+    Returns:
+        (g, x, y) with g = gcd(a, b) >= 0 and a*x + b*y == g
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+
+    if old_r < 0:
+        return -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def mod_inverse(a, m):
+    """
+    Modular inverse of a modulo m.
+
+    Raises:
+        ValueError: If m < 1 or a and m are not coprime
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError(f"{a} has no inverse modulo {m} (gcd is {g})")
+    return x % m
+
+
+# ===== SEQUENCES =====
+
+def gcd_reduce(values):
+    """GCD of every value in an iterable (0 for an empty one)."""
+    result = 0
+    for value in values:
+        result = math.gcd(result, value)
+        if result == 1:
+            break
+    return result
+
+
+def lcm_reduce(values):
+    """LCM of every value in an iterable (1 for an empty one)."""
+    result = 1
+    for value in values:
+        if value == 0:
+            return 0
+        result = result // math.gcd(result, value) * abs(value)
+    return result
+
+
+# ===== ARRAYS =====
+
+def gcd_array(a, b):
+    """
+    Elementwise GCD of two equal-length integer sequences.
+
+    Returns a NumPy array when NumPy is available (vectorized, for
+    millions of pairs), otherwise a list.
+    """
+    if np is not None:
+        return np.gcd(np.asarray(a), np.asarray(b))
+    if len(a) != len(b):
+        raise ValueError("Sequences must have the same length")
+    return list(map(math.gcd, a, b))
+
+
+def lcm_array(a, b):
+    """Elementwise LCM of two equal-length integer sequences."""
+    if np is not None:
+        return np.lcm(np.asarray(a), np.asarray(b))
+    if len(a) != len(b):
+        raise ValueError("Sequences must have the same length")
+    return list(map(lcm, a, b))
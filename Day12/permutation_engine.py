@@ -0,0 +1,174 @@
+# Permutation Engine - Day 12 Practice Project
+# Stream, count, rank and unrank permutations without building n! lists
+
+"""
+Lazy permutation generators with ranking and unranking.
+
+permutations() in recursion_visualizer builds every permutation in a
+list and repeats duplicates when characters repeat. The generators here
+yield one permutation at a time:
+
+    heap_permutations      - Heap's algorithm, one swap per step
+                             (all items treated as distinct)
+    lexicographic_permutations
+                           - next-permutation order, each distinct
+                             arrangement of a multiset exactly once
+    iter_permutations      - picks whichever of the two fits the input
+
+nth_permutation and rank jump straight to a position in lexicographic
+order, so permutations of 12+ characters can be sampled without
+enumerating them.
+
+Strings give back strings; any other sequence gives back tuples.
+"""
+
+from collections import Counter
+from math import factorial
+
+
+def _pack(items, template):
+    """Return items in the same shape as the caller's input."""
+    return "".join(items) if isinstance(template, str) else tuple(items)
+
+
+# ===== GENERATORS =====
+
+def heap_permutations(items):
+    """
+    Yield all n! orderings of items using iterative Heap's algorithm.
+
+    Each permutation differs from the previous one by a single swap.
+    Repeated items produce repeated permutations; use
+    lexicographic_permutations for unique output.
+    """
+    pool = list(items)
+    n = len(pool)
+    yield _pack(pool, items)
+
+    counters = [0] * n
+    i = 1
+    while i < n:
+        if counters[i] < i:
+            j = counters[i] if i % 2 else 0
+            pool[j], pool[i] = pool[i], pool[j]
+            yield _pack(pool, items)
+            counters[i] += 1
+            i = 1
+        else:
+            counters[i] = 0
+            i += 1
+
+
+def next_permutation(pool):
+    """
+    Rearrange list pool into the next permutation in lexicographic order.
+
+    Returns:
+        False if pool was already the last permutation (it is then
+        reset to the first one), True otherwise
+    """
+    # Find the rightmost ascent pool[i] < pool[i + 1]
+    i = len(pool) - 2
+    while i >= 0 and pool[i] >= pool[i + 1]:
+        i -= 1
+
+    if i < 0:
+        pool.reverse()
+        return False
+
+    # Swap it with the rightmost larger element, then reverse the tail
+    j = len(pool) - 1
+    while pool[j] <= pool[i]:
+        j -= 1
+    pool[i], pool[j] = pool[j], pool[i]
+    pool[i + 1:] = reversed(pool[i + 1:])
+    return True
+
+
+def lexicographic_permutations(items):
+    """Yield each distinct permutation of items once, in sorted order."""
+    pool = sorted(items)
+    yield _pack(pool, items)
+    while next_permutation(pool):
+        yield _pack(pool, items)
+
+
+def iter_permutations(items):
+    """
+    Yield the distinct permutations of items.
+
+    Uses Heap's algorithm when all items differ (cheapest per step) and
+    lexicographic order when some repeat (no duplicates).
+    """
+    if len(set(items)) == len(items):
+        return heap_permutations(items)
+    return lexicographic_permutations(items)
+
+
+# ===== COUNTING, RANKING, UNRANKING =====
+
+def count_permutations(items):
+    """Number of distinct permutations: n! / (c1! * c2! * ...)."""
+    total = factorial(len(items))
+    for count in Counter(items).values():
+        total //= factorial(count)
+    return total
+
+
+def nth_permutation(items, k):
+    """
+    Return the k-th distinct permutation (0-based, lexicographic order).
+
+    Raises:
+        IndexError: If k is outside 0 .. count_permutations(items) - 1
+    """
+    counts = Counter(items)
+    remaining = len(items)
+    block = count_permutations(items)
+
+    if not 0 <= k < block:
+        raise IndexError(f"Permutation index {k} out of range (0..{block - 1})")
+
+    symbols = sorted(counts)
+    result = []
+    while remaining:
+        for symbol in symbols:
+            if not counts[symbol]:
+                continue
+            # Permutations of the rest that start with this symbol
+            starting_here = block * counts[symbol] // remaining
+            if k < starting_here:
+                result.append(symbol)
+                counts[symbol] -= 1
+                remaining -= 1
+                block = starting_here
+                break
+            k -= starting_here
+
+    return _pack(result, items)
+
+
+def rank(perm):
+    """
+    Return the 0-based lexicographic position of perm among the
+    distinct permutations of its own items.
+
+    Inverse of nth_permutation: nth_permutation(perm, rank(perm)) == perm.
+    """
+    counts = Counter(perm)
+    symbols = sorted(counts)
+    remaining = len(perm)
+    block = count_permutations(perm)
+    position = 0
+
+    for item in perm:
+        for symbol in symbols:
+            if symbol == item:
+                break
+            if counts[symbol]:
+                position += block * counts[symbol] // remaining
+        block = block * counts[item] // remaining
+        counts[item] -= 1
+        remaining -= 1
+
+    return position
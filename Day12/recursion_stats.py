@@ -0,0 +1,194 @@
+# Recursion Statistics - Day 12 Practice Project
+# Count calls, depth and memo hits to see why naive recursion is slow
+
+"""
+Decorator-style profiler for recursive functions.
+
+For every profiled function it counts calls per argument tuple
+(unhashable arguments such as a memo dict are left out), the
+deepest recursion reached and, when a MemoCounter is used as the memo,
+cache hits and misses. summary_table() and histogram() turn the counts
+into text.
+
+    profiler = RecursionProfiler()
+
+    @profiler.profile
+    def fib(n): ...
+
+Existing functions can be profiled without editing them: patch()
+temporarily swaps the module attribute so recursive calls go through
+the wrapper too.
+
+    with profiler.patch(recursion_visualizer, "fibonacci_recursive"):
+        recursion_visualizer.fibonacci_recursive(20)
+
+A disabled profiler costs one attribute check per call. Counting is
+not thread-safe; profile one thread at a time.
+"""
+
+import functools
+from collections import Counter
+from collections.abc import Hashable
+from contextlib import contextmanager
+
+
+class FunctionStats:
+    """Counters collected for one function."""
+
+    __slots__ = ("name", "calls", "calls_by_args", "depth", "max_depth",
+                 "hits", "misses")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.calls_by_args = Counter()
+        self.depth = 0
+        self.max_depth = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """Fraction of memo lookups that hit, or None without lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class MemoCounter(dict):
+    """A memo dict that counts lookups as hits or misses."""
+
+    def __init__(self, stats):
+        super().__init__()
+        self._stats = stats
+
+    def __contains__(self, key):
+        found = dict.__contains__(self, key)
+        if found:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+        return found
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            self._stats.hits += 1
+            return dict.__getitem__(self, key)
+        self._stats.misses += 1
+        return default
+
+
+def _hashable_part(args):
+    """Drop unhashable arguments (such as a memo dict) from a call key."""
+    return tuple(arg for arg in args if isinstance(arg, Hashable))
+
+
+class RecursionProfiler:
+    """Registry of FunctionStats with a runtime on/off switch."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stats = {}
+
+    def stats_for(self, name):
+        """FunctionStats for name, created on first use."""
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = FunctionStats(name)
+        return stats
+
+    def reset(self):
+        """Forget all collected statistics."""
+        self.stats.clear()
+
+    def profile(self, func, name=None):
+        """Decorator recording calls, arguments and depth of func."""
+        name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+
+            stats = self.stats_for(name)
+            stats.calls += 1
+            try:
+                stats.calls_by_args[args] += 1
+            except TypeError:
+                stats.calls_by_args[_hashable_part(args)] += 1
+            stats.depth += 1
+            if stats.depth > stats.max_depth:
+                stats.max_depth = stats.depth
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.depth -= 1
+
+        return wrapper
+
+    @contextmanager
+    def patch(self, owner, attribute):
+        """
+        Profile owner.attribute (e.g. a module function) inside a with block.
+
+        Yields:
+            The FunctionStats being filled in
+        """
+        original = getattr(owner, attribute)
+        setattr(owner, attribute, self.profile(original, attribute))
+        try:
+            yield self.stats_for(attribute)
+        finally:
+            setattr(owner, attribute, original)
+
+    def memo(self, name):
+        """A MemoCounter recording hits and misses under name."""
+        return MemoCounter(self.stats_for(name))
+
+    # ===== REPORTING =====
+
+    def summary_table(self):
+        """Text table with one row per profiled function."""
+        header = (f"{'Function':<24} {'Calls':>12} {'Distinct':>9} "
+                  f"{'Max depth':>10} {'Hits':>8} {'Misses':>8} {'Hit rate':>9}")
+        lines = [header, "-" * len(header)]
+        for stats in self.stats.values():
+            rate = stats.hit_rate
+            lines.append(
+                f"{stats.name:<24} {stats.calls:>12,} {len(stats.calls_by_args):>9,} "
+                f"{stats.max_depth:>10} {stats.hits:>8,} {stats.misses:>8,} "
+                f"{'-' if rate is None else f'{rate:.1%}':>9}"
+            )
+        return "\n".join(lines)
+
+    def histogram(self, name, width=40, max_rows=30):
+        """Text bar chart of calls per argument tuple for one function."""
+        stats = self.stats.get(name)
+        if stats is None or not stats.calls_by_args:
+            return f"No calls recorded for {name}"
+
+        try:
+            rows = sorted(stats.calls_by_args.items())
+        except TypeError:
+            rows = stats.calls_by_args.most_common()
+        hidden = max(len(rows) - max_rows, 0)
+        rows = rows[:max_rows]
+
+        peak = max(count for _, count in rows)
+        labels = [", ".join(repr(arg) for arg in args) for args, _ in rows]
+        label_width = max(len(label) for label in labels)
+
+        lines = [f"Calls per argument for {name}:"]
+        for label, (_, count) in zip(labels, rows):
+            bar = "█" * max(1, round(count / peak * width))
+            lines.append(f"  ({label:>{label_width}}) {bar} {count:,}")
+        if hidden:
+            lines.append(f"  ... {hidden:,} more argument values")
+        return "\n".join(lines)
+
+
+profiler = RecursionProfiler()
+
+
+def profile(func):
+    """Profile func with the module-level profiler."""
+    return profiler.profile(func)
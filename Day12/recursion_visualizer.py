@@ -1,7 +1,16 @@
 # Recursion Visualizer - Day 12 Practice Project
 # Understand recursion through visualization and interactive examples
 
-import time
+import sys
+
+import call_trace
+import number_theory
+from fibonacci import fib_fast_doubling, fib_matrix
+from flatten import flatten
+from hanoi_solver import count_moves, iter_moves, kth_move, state_after
+from permutation_engine import (count_permutations, lexicographic_permutations,
+                                nth_permutation, rank)
+from recursion_stats import RecursionProfiler
 
 # ===== VISUALIZATION HELPERS =====
 
@@ -80,28 +89,78 @@ def fibonacci_visual(n, level=0):
     return result
 
 
+# ===== TRAMPOLINE =====
+
+# Recursion deeper than this switches to trampolined execution
+# automatically (Python's default recursion limit is 1000).
+SAFE_RECURSION_DEPTH = 500
+
+
+class Bounce:
+    """A pending call returned instead of recursing (see trampoline)."""
+    
+    __slots__ = ("func", "args")
+    
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+
+def trampoline(func, *args):
+    """
+    Run a tail-recursive function without growing the call stack.
+    
+    func returns either a final value or a Bounce describing the next
+    call; the loop keeps calling until a final value comes back.
+    """
+    result = func(*args)
+    while type(result) is Bounce:
+        result = result.func(*result.args)
+    return result
+
+
+def _use_trampoline(trampolined, show_steps, depth):
+    """Pick the execution mode when the caller didn't choose one."""
+    if trampolined is not None:
+        return trampolined
+    return not show_steps or depth > SAFE_RECURSION_DEPTH
+
+
 # ===== RECURSIVE ALGORITHMS =====
 
-def sum_list(numbers, level=0, show_steps=False):
-    """Sum all numbers in a list recursively."""
+def sum_list(numbers, level=0, show_steps=False, trampolined=None):
+    """
+    Sum all numbers in a list recursively.
+    
+    Each call looks at numbers[index] instead of slicing off a new
+    list, so the work is linear. With trampolined=True (the default
+    when not showing steps, or for long lists) the recursion runs
+    through trampoline() and has no depth limit.
+    """
+    if _use_trampoline(trampolined, show_steps, len(numbers)):
+        return trampoline(_sum_step, numbers, 0, 0, level, show_steps)
+    return _sum_from(numbers, 0, level, show_steps)
+
+
+def _sum_from(numbers, index, level, show_steps):
+    """Recursive case of sum_list for numbers[index:]."""
     if show_steps:
-        indent_print(level, f"→ sum_list({numbers})")
+        indent_print(level, f"→ sum_list({numbers[index:]})")
     
     # Base case: empty list
-    if not numbers:
+    if index == len(numbers):
         if show_steps:
             indent_print(level, "✓ Empty list, returning 0")
         return 0
     
     # Recursive case
-    first = numbers[0]
-    rest = numbers[1:]
+    first = numbers[index]
     
     if show_steps:
-        indent_print(level, f"Computing {first} + sum_list({rest})")
+        indent_print(level, f"Computing {first} + sum_list({numbers[index + 1:]})")
         print()
     
-    result = first + sum_list(rest, level + 1, show_steps)
+    result = first + _sum_from(numbers, index + 1, level + 1, show_steps)
     
     if show_steps:
         print()
@@ -110,55 +169,113 @@ def sum_list(numbers, level=0, show_steps=False):
     return result
 
 
-def reverse_string(s, level=0, show_steps=False):
-    """Reverse string recursively."""
+def _sum_step(numbers, index, total, level, show_steps):
+    """Tail-recursive step of sum_list carrying the running total."""
+    if index == len(numbers):
+        if show_steps:
+            indent_print(level, f"✓ End of list, returning {total}")
+        return total
+    
     if show_steps:
-        indent_print(level, f"→ reverse('{s}')")
+        indent_print(level, f"→ sum_list(numbers[{index}:]), running total {total}")
+    
+    return Bounce(_sum_step, numbers, index + 1, total + numbers[index],
+                  level + 1, show_steps)
+
+
+def reverse_string(s, level=0, show_steps=False, trampolined=None):
+    """
+    Reverse string recursively.
+    
+    Works on an end index and collects characters in a list that is
+    joined once, so no intermediate strings are built.
+    """
+    if _use_trampoline(trampolined, show_steps, len(s)):
+        chars = []
+        trampoline(_reverse_step, s, len(s) - 1, chars, level, show_steps)
+        return "".join(chars)
+    
+    chars = []
+    _reverse_upto(s, len(s) - 1, chars, level, show_steps)
+    return "".join(chars)
+
+
+def _reverse_upto(s, end, chars, level, show_steps):
+    """Recursive case of reverse_string for s[:end + 1]."""
+    if show_steps:
+        indent_print(level, f"→ reverse('{s[:end + 1]}')")
     
     # Base case
-    if len(s) <= 1:
+    if end <= 0:
+        if end == 0:
+            chars.append(s[0])
         if show_steps:
-            indent_print(level, f"✓ Base case, returning '{s}'")
-        return s
+            indent_print(level, f"✓ Base case, returning '{s[:end + 1]}'")
+        return
     
     # Recursive case
     if show_steps:
-        indent_print(level, f"Computing '{s[-1]}' + reverse('{s[:-1]}')")
+        indent_print(level, f"Computing '{s[end]}' + reverse('{s[:end]}')")
         print()
     
-    result = s[-1] + reverse_string(s[:-1], level + 1, show_steps)
+    chars.append(s[end])
+    _reverse_upto(s, end - 1, chars, level + 1, show_steps)
     
     if show_steps:
         print()
-        indent_print(level, f"← Returning '{result}'")
+        indent_print(level, f"← Returning '{s[end::-1]}'")
+
+
+def _reverse_step(s, end, chars, level, show_steps):
+    """Tail-recursive step of reverse_string."""
+    if end < 0:
+        if show_steps:
+            indent_print(level, f"✓ Done, reversed '{''.join(chars)}'")
+        return None
     
-    return result
+    if show_steps:
+        indent_print(level, f"→ reverse('{s[:end + 1]}'), taking '{s[end]}'")
+    
+    chars.append(s[end])
+    return Bounce(_reverse_step, s, end - 1, chars, level + 1, show_steps)
 
 
-def is_palindrome(s, level=0, show_steps=False):
-    """Check if string is palindrome recursively."""
+def is_palindrome(s, level=0, show_steps=False, trampolined=None):
+    """
+    Check if string is palindrome recursively.
+    
+    The string is normalized once, then each call compares s[left]
+    with s[right] and moves both indices inward.
+    """
     s = s.replace(" ", "").lower()
     
+    if _use_trampoline(trampolined, show_steps, len(s) // 2):
+        return trampoline(_palindrome_step, s, 0, len(s) - 1, level, show_steps)
+    return _palindrome_between(s, 0, len(s) - 1, level, show_steps)
+
+
+def _palindrome_between(s, left, right, level, show_steps):
+    """Recursive case of is_palindrome for s[left:right + 1]."""
     if show_steps:
-        indent_print(level, f"→ is_palindrome('{s}')")
+        indent_print(level, f"→ is_palindrome('{s[left:right + 1]}')")
     
     # Base case
-    if len(s) <= 1:
+    if right - left < 1:
         if show_steps:
             indent_print(level, "✓ Base case: True")
         return True
     
     # Check first and last
-    if s[0] != s[-1]:
+    if s[left] != s[right]:
         if show_steps:
-            indent_print(level, f"✗ '{s[0]}' != '{s[-1]}': False")
+            indent_print(level, f"✗ '{s[left]}' != '{s[right]}': False")
         return False
     
     if show_steps:
-        indent_print(level, f"✓ '{s[0]}' == '{s[-1]}', checking middle...")
+        indent_print(level, f"✓ '{s[left]}' == '{s[right]}', checking middle...")
         print()
     
-    result = is_palindrome(s[1:-1], level + 1, show_steps)
+    result = _palindrome_between(s, left + 1, right - 1, level + 1, show_steps)
     
     if show_steps:
         print()
@@ -167,73 +284,113 @@ def is_palindrome(s, level=0, show_steps=False):
     return result
 
 
-def gcd(a, b, level=0, show_steps=False):
-    """Find GCD using Euclidean algorithm."""
+def _palindrome_step(s, left, right, level, show_steps):
+    """Tail-recursive step of is_palindrome."""
+    if right - left < 1:
+        if show_steps:
+            indent_print(level, "✓ Base case: True")
+        return True
+    
+    if s[left] != s[right]:
+        if show_steps:
+            indent_print(level, f"✗ '{s[left]}' != '{s[right]}': False")
+        return False
+    
     if show_steps:
-        indent_print(level, f"→ gcd({a}, {b})")
+        indent_print(level, f"✓ '{s[left]}' == '{s[right]}', checking middle...")
+    
+    return Bounce(_palindrome_step, s, left + 1, right - 1, level + 1, show_steps)
+
+
+def gcd(a, b, level=0, show_steps=False):
+    """
+    Find GCD using Euclidean algorithm.
+    
+    Without show_steps this hands off to the shared number_theory
+    kernel instead of recursing.
+    """
+    if not show_steps:
+        return number_theory.gcd(a, b)
+    
+    indent_print(level, f"→ gcd({a}, {b})")
     
     # Base case
     if b == 0:
-        if show_steps:
-            indent_print(level, f"✓ Base case: gcd({a}, 0) = {a}")
+        indent_print(level, f"✓ Base case: gcd({a}, 0) = {a}")
         return a
     
     # Recursive case
-    if show_steps:
-        indent_print(level, f"Computing gcd({b}, {a % b})")
-        print()
+    indent_print(level, f"Computing gcd({b}, {a % b})")
+    print()
     
     result = gcd(b, a % b, level + 1, show_steps)
     
-    if show_steps:
-        print()
-        indent_print(level, f"← Returning {result}")
+    print()
+    indent_print(level, f"← Returning {result}")
     
     return result
 
 
 def binary_search(arr, target, left=0, right=None, level=0, show_steps=False):
-    """Binary search recursively."""
+    """
+    Binary search.
+    
+    Each "recursive call" of the classic version becomes one loop
+    iteration, so there is no call overhead or recursion limit. Steps
+    show the current window, listing its elements only while it is
+    small (the array is never sliced otherwise).
+    """
     if right is None:
         right = len(arr) - 1
     
-    if show_steps:
-        indent_print(level, f"→ search({arr[left:right+1]}, target={target})")
-    
-    # Base case: not found
-    if left > right:
-        if show_steps:
-            indent_print(level, "✗ Not found")
-        return -1
-    
-    mid = (left + right) // 2
-    
-    if show_steps:
-        indent_print(level, f"Middle element: arr[{mid}] = {arr[mid]}")
-    
-    # Base case: found
-    if arr[mid] == target:
-        if show_steps:
-            indent_print(level, f"✓ Found at index {mid}!")
-        return mid
-    
-    # Recursive cases
-    if arr[mid] > target:
+    while True:
         if show_steps:
-            indent_print(level, f"{arr[mid]} > {target}, searching left half")
-            print()
-        return binary_search(arr, target, left, mid - 1, level + 1, show_steps)
-    else:
+            if right - left < 16:
+                window = arr[left:right + 1]
+            else:
+                window = f"arr[{left}..{right}]"
+            indent_print(level, f"→ search({window}, target={target})")
+        
+        # Base case: not found
+        if left > right:
+            if show_steps:
+                indent_print(level, "✗ Not found")
+            return -1
+        
+        mid = (left + right) // 2
+        
         if show_steps:
-            indent_print(level, f"{arr[mid]} < {target}, searching right half")
-            print()
-        return binary_search(arr, target, mid + 1, right, level + 1, show_steps)
+            indent_print(level, f"Middle element: arr[{mid}] = {arr[mid]}")
+        
+        # Base case: found
+        if arr[mid] == target:
+            if show_steps:
+                indent_print(level, f"✓ Found at index {mid}!")
+            return mid
+        
+        # Narrow the window
+        if arr[mid] > target:
+            if show_steps:
+                indent_print(level, f"{arr[mid]} > {target}, searching left half")
+                print()
+            right = mid - 1
+        else:
+            if show_steps:
+                indent_print(level, f"{arr[mid]} < {target}, searching right half")
+                print()
+            left = mid + 1
+        
+        level += 1
 
 
 # ===== ADVANCED RECURSION =====
 
 def hanoi(n, source='A', target='C', auxiliary='B', level=0):
-    """Tower of Hanoi with visualization."""
+    """
+    Tower of Hanoi with visualization.
+    
+    Prints all 2^n - 1 moves; see hanoi_solver for streaming large puzzles.
+    """
     if n == 1:
         indent_print(level, f"Move disk 1: {source} → {target}")
         return
@@ -251,7 +408,12 @@ def hanoi(n, source='A', target='C', auxiliary='B', level=0):
 
 
 def permutations(s):
-    """Generate all permutations of a string."""
+    """
+    Generate all permutations of a string.
+    
+    Builds the whole list and repeats duplicates for repeated
+    characters; see permutation_engine for lazy, unique generators.
+    """
     # Base case
     if len(s) <= 1:
         return [s]
@@ -271,17 +433,13 @@ def permutations(s):
 
 
 def flatten_list(nested_list):
-    """Flatten a nested list recursively."""
-    result = []
-    
-    for item in nested_list:
-        if isinstance(item, list):
-            # Recursively flatten
-            result.extend(flatten_list(item))
-        else:
-            result.append(item)
+    """
+    Flatten a nested list.
     
-    return result
+    Uses the explicit-stack engine in flatten.py, so deeply nested
+    lists don't hit the recursion limit; only lists are expanded.
+    """
+    return flatten(nested_list, flatten_types=(list,))
 
 
 # ===== PERFORMANCE COMPARISON =====
@@ -347,12 +505,36 @@ def display_menu():
     print("=" * 60)
 
 
+def show_recorded(func, n, recorder=None):
+    """
+    Record a traced run once, then print the collapsed call tree.
+    
+    recorder(n) may replace call_trace.record(func, n), e.g. with an
+    iterative recorder for deep linear recursion.
+    """
+    if recorder is None:
+        result, trace = call_trace.record(func, n)
+    else:
+        result, trace = recorder(n)
+    print(call_trace.render(trace, collapse=True, max_lines=200))
+    print(f"\n{trace.call_count:,} calls recorded, max depth {trace.max_depth}")
+    
+    if input("Export Chrome trace JSON? (y/n): ").strip().lower() == 'y':
+        filename = f"{func.__name__}_{n}_trace.json"
+        events = call_trace.write_chrome_trace(trace, filename)
+        print(f"✓ Wrote {events:,} events to '{filename}'")
+    return result
+
+
 def run_countdown():
     """Run countdown demo."""
     print("\n--- Countdown Demo ---")
     n = int(input("Enter starting number: "))
     print()
-    countdown_visual(n)
+    if n <= 10:
+        countdown_visual(n)
+    else:
+        show_recorded(call_trace.countdown, n, call_trace.record_countdown)
 
 
 def run_factorial():
@@ -360,17 +542,24 @@ def run_factorial():
     print("\n--- Factorial Demo ---")
     n = int(input("Enter number: "))
     print()
-    result = factorial_visual(n)
-    print(f"\nFinal result: {n}! = {result}")
+    if n <= 10:
+        result = factorial_visual(n)
+    else:
+        result = show_recorded(call_trace.factorial, n, call_trace.record_factorial)
+    print(f"\nFinal result: {n}! = {call_trace.short_repr(result)}")
 
 
 def run_fibonacci():
     """Run fibonacci demo."""
     print("\n--- Fibonacci Demo ---")
-    n = int(input("Enter term number (recommend ≤ 5 for clarity): "))
+    n = int(input("Enter term number (≤ 5 prints every frame): "))
     print()
-    result = fibonacci_visual(n)
-    print(f"\nFinal result: fib({n}) = {result}")
+    if n <= 5:
+        result = fibonacci_visual(n)
+    else:
+        # Record first, render once with repeated subtrees collapsed
+        result = show_recorded(call_trace.fibonacci, n)
+    print(f"\nFinal result: fib({n}) = {call_trace.short_repr(result)}")
 
 
 def run_sum_list():
@@ -430,21 +619,54 @@ def run_binary_search():
 def run_hanoi():
     """Run Tower of Hanoi demo."""
     print("\n--- Tower of Hanoi Demo ---")
-    n = int(input("Enter number of disks (recommend ≤ 4): "))
+    n = int(input("Enter number of disks (≤ 6 prints every move): "))
     print()
-    hanoi(n)
+    if n <= 6:
+        hanoi(n)
+        return
+    
+    # Too many moves to print: analyze with the iterative solver instead
+    total = count_moves(n)
+    print(f"Total moves: {total:,}")
+    print("First moves:")
+    for number, (disk, source, target) in enumerate(iter_moves(n, stop=5), 1):
+        print(f"  {number}. Move disk {disk}: {source} → {target}")
+    
+    middle = (total + 1) // 2
+    disk, source, target = kth_move(n, middle)
+    print(f"\nMove {middle:,}: disk {disk}: {source} → {target}")
+    print(f"Pegs after {middle:,} moves:")
+    for peg, disks in state_after(n, middle).items():
+        shown = disks if len(disks) <= 10 else disks[:5] + ["..."] + disks[-5:]
+        print(f"  {peg}: {shown}")
 
 
 def run_permutations():
     """Run permutations demo."""
     print("\n--- Permutations Demo ---")
-    text = input("Enter text (recommend ≤ 4 chars): ")
+    text = input("Enter text (recommend ≤ 4 chars for the full list): ")
     print()
-    result = permutations(text)
-    print("All permutations:")
-    for i, perm in enumerate(result, 1):
+    
+    total = count_permutations(text)
+    if len(text) <= 6:
+        result = permutations(text)
+        print("All permutations (recursive):")
+        for i, perm in enumerate(result, 1):
+            print(f"{i:2}. {perm}")
+        print(f"\nTotal: {len(result)} permutations")
+    
+    # Stream unique permutations lazily instead of building a list
+    print(f"\nDistinct permutations: {total:,}")
+    print("First few (lexicographic, streamed):")
+    for i, perm in enumerate(lexicographic_permutations(text), 1):
         print(f"{i:2}. {perm}")
-    print(f"\nTotal: {len(result)} permutations")
+        if i == 10:
+            break
+    
+    if total > 1:
+        middle = total // 2
+        perm = nth_permutation(text, middle)
+        print(f"\nPermutation #{middle:,}: {perm} (rank {rank(perm):,})")
 
 
 def run_flatten():
@@ -461,32 +683,70 @@ def run_flatten():
 
 def run_performance():
     """Run performance comparison."""
+    from benchmark import format_duration, measure, summarize
+    
     print("\n--- Fibonacci Performance Comparison ---")
-    n = int(input("Enter term number (recommend ≤ 35): "))
-    
-    print("\n1. Recursive (slow):")
-    start = time.time()
-    result1 = fibonacci_recursive(n)
-    time1 = time.time() - start
-    print(f"   Result: {result1}")
-    print(f"   Time: {time1:.6f} seconds")
-    
-    print("\n2. Iterative (fast):")
-    start = time.time()
-    result2 = fibonacci_iterative(n)
-    time2 = time.time() - start
-    print(f"   Result: {result2}")
-    print(f"   Time: {time2:.6f} seconds")
-    
-    print("\n3. Memoized (fast):")
-    start = time.time()
-    result3 = fibonacci_memoized(n)
-    time3 = time.time() - start
-    print(f"   Result: {result3}")
-    print(f"   Time: {time3:.6f} seconds")
-    
-    print(f"\nSpeedup: Iterative is {time1/time2:.0f}x faster than recursive")
-    print(f"Speedup: Memoized is {time1/time3:.0f}x faster than recursive")
+    n = int(input("Enter term number (try ≤ 35, or 1000000 for fast methods): "))
+    
+    # Slow methods are skipped once they would take too long or
+    # exceed the recursion limit.
+    methods = [
+        ("Recursive (slow)", fibonacci_recursive, 35),
+        ("Iterative (fast)", fibonacci_iterative, 200_000),
+        ("Memoized (fast)", fibonacci_memoized, 900),
+        ("Fast doubling (O(log n))", fib_fast_doubling, None),
+        ("Matrix power (O(log n))", fib_matrix, None),
+    ]
+    
+    timings = {}
+    results = set()
+    
+    for number, (name, func, limit) in enumerate(methods, 1):
+        print(f"\n{number}. {name}:")
+        if limit is not None and n > limit:
+            print(f"   Skipped (n > {limit:,})")
+            continue
+        
+        result = func(n)
+        results.add(result)
+        stats = summarize(measure(func, (n,), repeats=5, warmup=0,
+                                  max_seconds=1.0))
+        timings[name] = stats["median_ns"]
+        
+        digits = len(str(result)) if n < 20_000 else int(n * 0.20898764) + 1
+        shown = str(result) if digits <= 30 else f"{digits:,} digits"
+        print(f"   Result: {shown}")
+        print(f"   Time: median {format_duration(stats['median_ns'])}, "
+              f"p95 {format_duration(stats['p95_ns'])} ({stats['runs']} runs)")
+    
+    if len(results) > 1:
+        print("\n✗ Methods disagree!")
+    
+    if n <= 25:
+        show_call_stats(n)
+    
+    slowest = max(timings, key=timings.get)
+    for name, elapsed in timings.items():
+        if name != slowest and elapsed > 0:
+            print(f"Speedup: {name} is {timings[slowest] / elapsed:.0f}x "
+                  f"faster than {slowest}")
+
+
+def show_call_stats(n):
+    """Compare call counts of naive and memoized Fibonacci for fib(n)."""
+    module = sys.modules[__name__]
+    profiler = RecursionProfiler()
+    
+    with profiler.patch(module, "fibonacci_recursive"):
+        fibonacci_recursive(n)
+    
+    with profiler.patch(module, "fibonacci_memoized"):
+        fibonacci_memoized(n, profiler.memo("fibonacci_memoized"))
+    
+    print("\n--- Call Statistics ---")
+    print(profiler.summary_table())
+    print()
+    print(profiler.histogram("fibonacci_recursive", width=30))
 
 
 def main():
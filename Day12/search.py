@@ -0,0 +1,167 @@
+# Search Engine - Day 12 Practice Project
+# Iterative, batched and cache-friendly binary search
+
+"""
+Binary search building blocks for sorted sequences.
+
+    find            - iterative binary search, no recursion or slicing
+    search_many     - k lookups at once: sort the targets, then walk
+                      the array once (O(n + k log k)) or narrow each
+                      search from the previous hit, whichever is cheaper
+    EytzingerIndex  - the sorted values stored in breadth-first tree
+                      order, so the first probes of every query hit the
+                      same few cache lines; good for many repeated
+                      queries against one array
+
+All functions return the index of the leftmost match in the original
+sorted array, or -1 if the target is missing.
+"""
+
+from array import array
+from bisect import bisect_left
+from math import log2
+
+
+def find(arr, target, lo=0, hi=None):
+    """
+    Iterative binary search in arr[lo:hi].
+
+    Returns:
+        Index of the leftmost element equal to target, or -1
+    """
+    if hi is None:
+        hi = len(arr)
+    end = hi
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    if lo < end and arr[lo] == target:
+        return lo
+    return -1
+
+
+def search_many(arr, targets):
+    """
+    Look up many targets in sorted arr.
+
+    Targets are sorted once (k log k). When k is large relative to n a
+    single merge-style pass over arr answers them all in O(n + k);
+    otherwise each bisect starts where the previous one stopped.
+
+    Returns:
+        List of indices (or -1), in the same order as targets
+    """
+    n = len(arr)
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+    results = [-1] * len(targets)
+
+    if not n or not order:
+        return results
+
+    if len(order) * log2(n + 1) >= n:
+        # Merge: advance through arr and the sorted targets together
+        i = 0
+        for position in order:
+            target = targets[position]
+            while i < n and arr[i] < target:
+                i += 1
+            if i == n:
+                break
+            if arr[i] == target:
+                results[position] = i
+    else:
+        lo = 0
+        for position in order:
+            target = targets[position]
+            lo = bisect_left(arr, target, lo)
+            if lo == n:
+                break
+            if arr[lo] == target:
+                results[position] = lo
+
+    return results
+
+
+class EytzingerIndex:
+    """
+    Read-only search index over a sorted sequence in Eytzinger layout.
+
+    Node k's children live at 2k and 2k + 1 (1-based), so a search walks
+    down the array with k = 2k + (value < target) and never branches on
+    the comparison. Numeric values are packed into a typed array to keep
+    them contiguous.
+    """
+
+    def __init__(self, sorted_values, typecode=None):
+        """
+        Args:
+            sorted_values: Values in ascending order
+            typecode: array module typecode such as 'q' or 'd' to pack
+                the values, or None to keep a plain list
+        """
+        n = len(sorted_values)
+        self.size = n
+        layout = [None] * (n + 1)
+        positions = array('q', bytes(8 * (n + 1)))
+
+        # In-order walk of the implicit tree assigns sorted values
+        source = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            layout[k] = sorted_values[source]
+            positions[k] = source
+            source += 1
+            k = 2 * k + 1
+
+        if typecode is not None and n:
+            layout[0] = sorted_values[0]
+            layout = array(typecode, layout)
+
+        self._values = layout
+        self._positions = positions
+
+    def __len__(self):
+        return self.size
+
+    def lower_bound(self, target):
+        """
+        Index (in the original sorted order) of the first value >= target.
+
+        Returns:
+            An index in 0 .. len(self); len(self) if every value is smaller
+        """
+        values = self._values
+        n = self.size
+        k = 1
+        while k <= n:
+            k = 2 * k + (values[k] < target)
+        # Undo the trailing right turns plus the final step
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self._positions[k] if k else n
+
+    def find(self, target):
+        """Index of the leftmost value equal to target, or -1."""
+        values = self._values
+        n = self.size
+        k = 1
+        while k <= n:
+            k = 2 * k + (values[k] < target)
+        k >>= ((~k) & (k + 1)).bit_length()
+        if k and values[k] == target:
+            return self._positions[k]
+        return -1
+
+    def find_many(self, targets):
+        """find() for every target, in order."""
+        find = self.find
+        return [find(target) for target in targets]
@@ -0,0 +1,247 @@
+# Bulk Validator - Day 13 Practice Project
+# Validate millions of emails and passwords without raising exceptions
+
+"""
+High-throughput versions of validate_email and validate_password.
+
+Instead of raising, every value gets an integer error code (VALID when
+it passes). The checks, their order and the messages in ERROR_MESSAGES
+match the single-value functions in robust_app, so
+
+    validate_email(x) raises InvalidEmailError(ERROR_MESSAGES[code])
+
+whenever email_error_code(x) returns a non-zero code.
+"""
+
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# ===== ERROR CODES =====
+
+VALID = 0
+
+EMAIL_MISSING_AT = 1
+EMAIL_MULTIPLE_AT = 2
+EMAIL_NO_USERNAME = 3
+EMAIL_BAD_DOMAIN = 4
+
+PASSWORD_TOO_SHORT = 11
+PASSWORD_NO_UPPER = 12
+PASSWORD_NO_LOWER = 13
+PASSWORD_NO_DIGIT = 14
+PASSWORD_NO_SPECIAL = 15
+
+ERROR_MESSAGES = {
+    VALID: "Valid",
+    EMAIL_MISSING_AT: "Email must contain '@'",
+    EMAIL_MULTIPLE_AT: "Email must have exactly one '@'",
+    EMAIL_NO_USERNAME: "Email must have username before '@'",
+    EMAIL_BAD_DOMAIN: "Email domain must contain '.'",
+    PASSWORD_TOO_SHORT: "Password must be at least 8 characters",
+    PASSWORD_NO_UPPER: "Password must contain uppercase letter",
+    PASSWORD_NO_LOWER: "Password must contain lowercase letter",
+    PASSWORD_NO_DIGIT: "Password must contain digit",
+    PASSWORD_NO_SPECIAL: "Password must contain special character",
+}
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+# ===== PRECOMPILED TABLES =====
+
+# One '@', something before it, and a '.' somewhere after it
+_VALID_EMAIL = re.compile(r"[^@]+@[^@]*\.[^@]*")
+
+SPECIAL_CHARACTERS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+_UPPER = 1
+_LOWER = 2
+_DIGIT = 4
+_SPECIAL = 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+
+
+def _char_class(c):
+    """Bitmask of the password character classes c belongs to."""
+    mask = 0
+    if c.isupper():
+        mask |= _UPPER
+    if c.islower():
+        mask |= _LOWER
+    if c.isdigit():
+        mask |= _DIGIT
+    if c in SPECIAL_CHARACTERS:
+        mask |= _SPECIAL
+    return mask
+
+
+# Lookup table for ASCII; other characters fall back to _char_class
+_ASCII_CLASSES = {chr(i): _char_class(chr(i)) for i in range(128)}
+
+
+# ===== SINGLE-VALUE CODES =====
+
+def email_error_code(email):
+    """Return the error code for one email (VALID if it passes)."""
+    if _VALID_EMAIL.fullmatch(email):
+        return VALID
+    return _email_failure_code(email)
+
+
+def _email_failure_code(email):
+    """Classify an email already known to fail the fast-path regex."""
+    at_count = email.count('@')
+    if at_count == 0:
+        return EMAIL_MISSING_AT
+    if at_count > 1:
+        return EMAIL_MULTIPLE_AT
+    if email[0] == '@':
+        return EMAIL_NO_USERNAME
+    return EMAIL_BAD_DOMAIN
+
+
+def password_error_code(password):
+    """Return the error code for one password (VALID if it passes)."""
+    if len(password) < 8:
+        return PASSWORD_TOO_SHORT
+
+    mask = 0
+    table = _ASCII_CLASSES
+    for c in set(password):
+        found = table.get(c)
+        mask |= _char_class(c) if found is None else found
+        if mask == _ALL_CLASSES:
+            return VALID
+
+    if not mask & _UPPER:
+        return PASSWORD_NO_UPPER
+    if not mask & _LOWER:
+        return PASSWORD_NO_LOWER
+    if not mask & _DIGIT:
+        return PASSWORD_NO_DIGIT
+    return PASSWORD_NO_SPECIAL
+
+
+def _email_chunk_codes(emails):
+    """Codes for a list of emails; the regex alone settles valid ones."""
+    fullmatch = _VALID_EMAIL.fullmatch
+    slow = _email_failure_code
+    return [VALID if fullmatch(email) else slow(email) for email in emails]
+
+
+def _password_chunk_codes(passwords):
+    """Codes for a list of passwords."""
+    return list(map(password_error_code, passwords))
+
+
+_CHUNK_CHECKS = {
+    "email": _email_chunk_codes,
+    "password": _password_chunk_codes,
+}
+
+
+def _validate_chunk(kind, values):
+    """Validate a chunk in a worker, returning one code byte per value."""
+    return bytes(_CHUNK_CHECKS[kind](values))
+
+
+# ===== BULK API =====
+
+def _chunks(values, chunk_size):
+    """Split an iterable into lists of at most chunk_size items."""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_error_codes(values, kind, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield an error code for every value, in input order.
+
+    Args:
+        values: Any iterable of strings (consumed lazily)
+        kind: 'email' or 'password'
+        processes: Worker processes to fan out to, or None to stay
+            in this process
+        chunk_size: Values sent to a worker at a time
+
+    Yields:
+        Integer error codes
+    """
+    if kind not in _CHUNK_CHECKS:
+        raise ValueError(f"Unknown kind '{kind}', expected 'email' or 'password'")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if not processes:
+        check_chunk = _CHUNK_CHECKS[kind]
+        for chunk in _chunks(values, chunk_size):
+            yield from check_chunk(chunk)
+        return
+
+    # Keep a bounded window of chunks in flight so memory stays flat
+    # even when values is a 10M-line file.
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = deque()
+        for chunk in _chunks(values, chunk_size):
+            pending.append(pool.submit(_validate_chunk, kind, chunk))
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def validate_emails_bulk(emails, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validate many emails at once.
+
+    Returns:
+        List of error codes, one per email (VALID for good ones)
+    """
+    if not processes and isinstance(emails, list):
+        return _email_chunk_codes(emails)
+    return list(iter_error_codes(emails, "email", processes, chunk_size))
+
+
+def validate_passwords_bulk(passwords, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validate many passwords at once.
+
+    Returns:
+        List of error codes, one per password (VALID for good ones)
+    """
+    if not processes and isinstance(passwords, list):
+        return _password_chunk_codes(passwords)
+    return list(iter_error_codes(passwords, "password", processes, chunk_size))
+
+
+def validate_file(filename, kind, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream a file with one value per line and validate every line.
+
+    Trailing newlines are stripped before validation. The file is read
+    lazily, so memory use does not grow with file size.
+
+    Yields:
+        (line_number, code) tuples for lines that fail validation
+    """
+    with open(filename, 'r', encoding='utf-8', newline='') as file:
+        lines = (line.rstrip('\r\n') for line in file)
+        codes = iter_error_codes(lines, kind, processes, chunk_size)
+        for line_number, code in enumerate(codes, 1):
+            if code != VALID:
+                yield line_number, code
+
+
+def summarize(codes):
+    """Count how many values hit each error code."""
+    counts = {}
+    for code in codes:
+        counts[code] = counts.get(code, 0) + 1
+    return {ERROR_MESSAGES[code]: count for code, count in sorted(counts.items())}
@@ -0,0 +1,331 @@
+# Resilience Helpers - Day 13 Practice Project
+# Retries with backoff, time budgets and circuit breaking
+
+"""
+Retry and circuit breaker helpers built on the retry_operation idea.
+
+Unlike retry_operation, the retry options here are keyword-only, so
+positional arguments go straight to the wrapped function:
+
+    retry_call(fetch, url, max_attempts=5, base_delay=0.2)
+
+Keyword arguments that are not retry options are also passed through.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, name, retry_after):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit '{name}' is open, retry in {retry_after:.2f} seconds"
+        )
+
+
+class RetryBudgetExceeded(Exception):
+    """Raised when the total time budget runs out before a success."""
+    pass
+
+
+# ===== CIRCUIT BREAKER =====
+
+class CircuitBreaker:
+    """
+    Fail fast after repeated errors instead of hammering a dependency.
+
+    States:
+        closed    - calls pass through, failures are counted
+        open      - calls are rejected with CircuitOpenError
+        half-open - after reset_timeout one trial call is let through;
+                    success closes the circuit, failure opens it again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, name="default"):
+        """
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before a trial call
+            name: Label used in error messages
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Current state, moving from open to half-open when due."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if (self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout):
+            self._state = self.HALF_OPEN
+            self._trial_running = False
+        return self._state
+
+    def before_call(self):
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            state = self._current_state()
+
+            if state == self.OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(self.name, max(remaining, 0.0))
+
+            if state == self.HALF_OPEN:
+                if self._trial_running:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trial_running = True
+
+    def record_success(self):
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._trial_running = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if (self._state == self.HALF_OPEN
+                    or self.failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+    def record_interrupted(self):
+        """
+        Release a call that ended without a result or an error.
+
+        Cancellation (asyncio.CancelledError) and KeyboardInterrupt say
+        nothing about the dependency, so they don't count as failures.
+        A half-open trial still has to end, though, or every later call
+        would be rejected: the circuit reopens and the next trial is
+        allowed after reset_timeout.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trial_running:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+    def call(self, func, *args, **kwargs):
+        """Call func through the breaker."""
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.record_interrupted()
+            raise
+        self.record_success()
+        return result
+
+    def reset(self):
+        """Force the circuit closed."""
+        self.record_success()
+
+
+# ===== BACKOFF =====
+
+def backoff_delays(base_delay=0.1, factor=2.0, max_delay=10.0, jitter=True):
+    """
+    Generate delays for exponential backoff.
+
+    With jitter, each delay is drawn uniformly from [0, cap] ("full
+    jitter"), which spreads out clients that failed at the same moment.
+
+    Yields:
+        Delay in seconds before the next attempt
+    """
+    cap = base_delay
+    while True:
+        delay = min(cap, max_delay)
+        yield random.uniform(0, delay) if jitter else delay
+        cap *= factor
+
+
+def _plan_next_attempt(attempt, max_attempts, delays, deadline, error, verbose):
+    """
+    Decide how long to wait before the next attempt.
+
+    Returns:
+        Delay in seconds, or None if no attempts remain
+    """
+    if verbose:
+        print(f"  Attempt {attempt}/{max_attempts} failed: {error}")
+
+    if attempt >= max_attempts:
+        return None
+
+    delay = next(delays)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        delay = min(delay, remaining)
+
+    if verbose:
+        print(f"   Retrying in {delay:.2f} seconds...")
+    return delay
+
+
+def _give_up(max_attempts, deadline, last_exception, verbose):
+    """Raise the right exception once retrying stops."""
+    if deadline is not None and time.monotonic() >= deadline:
+        if verbose:
+            print("✗ Retry time budget exhausted")
+        raise RetryBudgetExceeded("Retry time budget exhausted") from last_exception
+
+    if verbose:
+        print(f"✗ All {max_attempts} attempts failed")
+    raise last_exception
+
+
+# ===== RETRY =====
+
+def retry_call(func, *args, max_attempts=3, base_delay=0.1, backoff=2.0,
+               max_delay=10.0, jitter=True, retry_on=(Exception,),
+               timeout=None, breaker=None, verbose=True, **kwargs):
+    """
+    Call func, retrying failures with exponential backoff.
+
+    Args:
+        func: Function to call
+        *args, **kwargs: Arguments to pass to function
+        max_attempts: Maximum number of attempts
+        base_delay: Delay before the first retry in seconds
+        backoff: Multiplier applied to the delay after each retry
+        max_delay: Upper bound for a single delay
+        jitter: Randomize delays to avoid synchronized retries
+        retry_on: Exception types worth retrying; others propagate at once
+        timeout: Total time budget in seconds, or None for no limit
+        breaker: Optional CircuitBreaker guarding the dependency
+        verbose: Print progress like retry_operation
+
+    Returns:
+        Function result if successful
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call
+        RetryBudgetExceeded: If the time budget runs out
+        Exception from the last failed attempt otherwise
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    delays = backoff_delays(base_delay, backoff, max_delay, jitter)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    last_exception = None
+
+    for attempt in range(1, max_attempts + 1):
+        if breaker is not None:
+            breaker.before_call()
+
+        try:
+            result = func(*args, **kwargs)
+        except retry_on as e:
+            if breaker is not None:
+                breaker.record_failure()
+            last_exception = e
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.record_interrupted()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            if verbose and attempt > 1:
+                print(f"✓ Succeeded on attempt {attempt}")
+            return result
+
+        delay = _plan_next_attempt(attempt, max_attempts, delays, deadline,
+                                   last_exception, verbose)
+        if delay is None:
+            break
+        time.sleep(delay)
+
+    _give_up(max_attempts, deadline, last_exception, verbose)
+
+
+async def async_retry_call(func, *args, max_attempts=3, base_delay=0.1,
+                           backoff=2.0, max_delay=10.0, jitter=True,
+                           retry_on=(Exception,), timeout=None, breaker=None,
+                           verbose=True, **kwargs):
+    """
+    Async version of retry_call for coroutine functions.
+
+    Waits with asyncio.sleep so other tasks keep running between
+    attempts. Takes the same options as retry_call.
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    delays = backoff_delays(base_delay, backoff, max_delay, jitter)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    last_exception = None
+
+    for attempt in range(1, max_attempts + 1):
+        if breaker is not None:
+            breaker.before_call()
+
+        try:
+            result = await func(*args, **kwargs)
+        except retry_on as e:
+            if breaker is not None:
+                breaker.record_failure()
+            last_exception = e
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.record_interrupted()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            if verbose and attempt > 1:
+                print(f"✓ Succeeded on attempt {attempt}")
+            return result
+
+        delay = _plan_next_attempt(attempt, max_attempts, delays, deadline,
+                                   last_exception, verbose)
+        if delay is None:
+            break
+        await asyncio.sleep(delay)
+
+    _give_up(max_attempts, deadline, last_exception, verbose)
@@ -1,9 +1,18 @@
 # Robust Application Framework - Day 13 Practice Project
 # Master error handling through a comprehensive application
 
+import io
+import itertools
+import json
+import mmap
 import os
+import time
+from collections import deque
 from datetime import datetime
 
+from bulk_validator import ERROR_MESSAGES, validate_emails_bulk
+from resilience import CircuitBreaker, CircuitOpenError, retry_call
+
 # ===== CUSTOM EXCEPTIONS =====
 
 class ValidationError(Exception):
@@ -193,29 +202,140 @@ def safe_read_file(filename):
     Returns:
         File content or None if error occurred
     """
+    file = _open_for_reading(filename)
+    if file is None:
+        return None
+    
     try:
-        with open(filename, 'r') as file:
+        with file:
             content = file.read()
-            print(f"✓ Successfully read {len(content)} characters")
-            return content
+    except Exception as e:
+        print(f"✗ Unexpected error reading file: {e}")
+        return None
     
+    print(f"✓ Successfully read {len(content)} characters")
+    return content
+
+
+def _open_for_reading(filename, mode='r'):
+    """
+    Open file for reading, printing a ✗ message on failure.
+
+    Returns:
+        Open file object or None if error occurred
+    """
+    try:
+        return open(filename, mode)
+
     except FileNotFoundError:
         print(f"✗ Error: File '{filename}' not found")
         return None
-    
+
     except PermissionError:
         print(f"✗ Error: No permission to read '{filename}'")
         return None
-    
+
     except IsADirectoryError:
         print(f"✗ Error: '{filename}' is a directory, not a file")
         return None
-    
+
     except Exception as e:
         print(f"✗ Unexpected error reading file: {e}")
         return None
 
 
+def _iter_file(file, read_next):
+    """
+    Yield items from an open file until exhausted, then close it.
+
+    An error part-way through (e.g. UnicodeDecodeError) is printed and
+    re-raised, so a failed read can't pass for a complete, shorter file.
+    """
+    with file:
+        try:
+            while True:
+                item = read_next(file)
+                if not item:
+                    break
+                yield item
+
+        except Exception as e:
+            print(f"✗ Unexpected error reading file: {e}")
+            raise
+
+
+def safe_iter_lines(filename):
+    """
+    Iterate over file lines in constant memory.
+
+    The file is opened immediately so errors are reported up front,
+    the same way as safe_read_file.
+
+    Returns:
+        Iterator of lines or None if error occurred
+
+    Raises:
+        Exception: From the iterator, if reading fails part-way through
+    """
+    file = _open_for_reading(filename)
+    if file is None:
+        return None
+    return _iter_file(file, lambda f: f.readline())
+
+
+def safe_iter_chunks(filename, size=1024 * 1024):
+    """
+    Iterate over file contents in chunks of at most `size` characters.
+
+    Args:
+        filename: File to read
+        size: Maximum characters per chunk
+
+    Returns:
+        Iterator of strings or None if error occurred
+
+    Raises:
+        Exception: From the iterator, if reading fails part-way through
+    """
+    if size <= 0:
+        print("✗ Error: Chunk size must be positive")
+        return None
+
+    file = _open_for_reading(filename)
+    if file is None:
+        return None
+    return _iter_file(file, lambda f: f.read(size))
+
+
+def safe_mmap(filename):
+    """
+    Map a file into memory read-only for zero-copy access.
+
+    The returned mmap behaves like a bytes object and should be
+    closed by the caller (it supports the `with` statement).
+
+    Returns:
+        mmap.mmap object or None if error occurred
+    """
+    file = _open_for_reading(filename, 'rb')
+    if file is None:
+        return None
+
+    with file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            print(f"✓ Successfully mapped {len(mapped)} bytes")
+            return mapped
+
+        except ValueError:
+            print(f"✗ Error: Cannot map empty file '{filename}'")
+            return None
+
+        except Exception as e:
+            print(f"✗ Unexpected error mapping file: {e}")
+            return None
+
+
 def safe_write_file(filename, content):
     """
     Write to file with error handling.
@@ -242,6 +362,152 @@ def safe_write_file(filename, content):
         return False
 
 
+class SafeWriter:
+    """
+    Buffered writer that never leaves a half-written file behind.
+
+    In 'w' mode records go to a temporary file in the same directory,
+    which atomically replaces the target on a clean exit. If the block
+    raises, the temporary file is discarded and the target is untouched.
+    In 'a' mode records are appended to the target through a large
+    buffer, so many small writes become few system calls.
+
+    Usage:
+        with SafeWriter("report.txt") as writer:
+            writer.write_records(lines)
+    """
+
+    def __init__(self, filename, mode='w', buffer_size=1024 * 1024,
+                 fsync=False, encoding='utf-8'):
+        """
+        Args:
+            filename: Target file
+            mode: 'w' for atomic replace, 'a' for buffered append
+            buffer_size: Write buffer size in bytes
+            fsync: Force data to disk before closing
+            encoding: Text encoding
+        """
+        if mode not in ('w', 'a'):
+            raise ValueError("Mode must be 'w' or 'a'")
+
+        self.filename = filename
+        self.mode = mode
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.encoding = encoding
+        self.records_written = 0
+        self._file = None
+        self._temp_name = None
+
+    def __enter__(self):
+        try:
+            if self.mode == 'a':
+                self._file = open(self.filename, 'a', buffering=self.buffer_size,
+                                  encoding=self.encoding)
+            else:
+                raw = io.FileIO(self._create_temp_file(), 'w')  # owns the fd
+                try:
+                    self._file = io.TextIOWrapper(
+                        io.BufferedWriter(raw, self.buffer_size),
+                        encoding=self.encoding,
+                    )
+                except BaseException:
+                    # e.g. an unknown encoding: don't leak the fd or the file
+                    raw.close()
+                    os.remove(self._temp_name)
+                    self._temp_name = None
+                    raise
+
+        except PermissionError:
+            print(f"✗ Error: No permission to write to '{self.filename}'")
+            raise
+
+        except IsADirectoryError:
+            print(f"✗ Error: '{self.filename}' is a directory")
+            raise
+
+        return self
+
+    def _create_temp_file(self):
+        """
+        Create a unique temporary file next to the target and return its fd.
+
+        Created with mode 0o666 so the kernel applies the umask, exactly
+        as open() would for the target itself.
+        """
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        while True:
+            name = os.path.join(directory, f".tmp-{os.urandom(6).hex()}.part")
+            try:
+                fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                continue
+            self._temp_name = name
+            return fd
+
+    def write(self, record):
+        """Write a single string record."""
+        self._file.write(record)
+        self.records_written += 1
+
+    def write_records(self, records, end='\n'):
+        """Write an iterable of records, each followed by `end`."""
+        count = 0
+
+        def terminated():
+            nonlocal count
+            for record in records:
+                count += 1
+                yield record + end
+
+        self._file.writelines(terminated())
+        self.records_written += count
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            try:
+                if exc_type is None:
+                    self._file.flush()
+                    if self.fsync:
+                        os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+
+            if self.mode == 'w':
+                if exc_type is None:
+                    self._commit()
+                else:
+                    os.remove(self._temp_name)
+                    print(f"✗ Write to '{self.filename}' aborted, file unchanged")
+
+        except Exception as e:
+            if self._temp_name and os.path.exists(self._temp_name):
+                os.remove(self._temp_name)
+            print(f"✗ Unexpected error writing file: {e}")
+            raise
+
+        if exc_type is None:
+            print(f"✓ Successfully wrote {self.records_written} records to "
+                  f"'{self.filename}'")
+        return False
+
+    def _commit(self):
+        """Move the temporary file over the target."""
+        if os.path.exists(self.filename):
+            os.chmod(self._temp_name, os.stat(self.filename).st_mode & 0o7777)
+
+        os.replace(self._temp_name, self.filename)
+        self._temp_name = None
+
+        if self.fsync and hasattr(os, 'O_DIRECTORY'):
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+
 def safe_delete_file(filename):
     """Delete file with error handling."""
     try:
@@ -269,13 +535,52 @@ def safe_delete_file(filename):
 # ===== BANKING SYSTEM WITH ERROR HANDLING =====
 
 class BankAccount:
-    """Bank account with robust error handling."""
-    
-    def __init__(self, account_number, initial_balance=0):
-        """Initialize account."""
+    """
+    Bank account with robust error handling.
+
+    Transactions are stored as compact tuples
+    (epoch_seconds, type_code, amount, balance, counterparty) and only
+    formatted when shown. With max_history set, the history is a ring
+    buffer; older entries are spilled to history_file if one is given,
+    otherwise they are dropped.
+    """
+
+    DEPOSIT = 0
+    WITHDRAWAL = 1
+    TRANSFER_OUT = 2
+    TRANSFER_IN = 3
+
+    TYPE_LABELS = {
+        DEPOSIT: "Deposit",
+        WITHDRAWAL: "Withdrawal",
+        TRANSFER_OUT: "Transfer to {}",
+        TRANSFER_IN: "Transfer from {}",
+    }
+
+    def __init__(self, account_number, initial_balance=0, max_history=None,
+                 history_file=None):
+        """
+        Initialize account.
+
+        Args:
+            account_number: Account identifier
+            initial_balance: Starting balance
+            max_history: Transactions kept in memory, or None for no limit
+            history_file: File receiving entries pushed out of memory
+                (JSON lines; may be shared by several accounts)
+        """
+        if max_history is not None and max_history < 1:
+            raise ValueError("max_history must be at least 1")
+
         self.account_number = account_number
         self.balance = initial_balance
-        self.transaction_history = []
+        self.max_history = max_history
+        self.history_file = history_file
+        self.spilled_count = 0
+        # Without a spill file the deque drops its oldest entry by itself;
+        # with one, entries leave in batches so the file is opened rarely.
+        spill = history_file is not None
+        self.transaction_history = deque(maxlen=None if spill else max_history)
     
     def deposit(self, amount):
         """
@@ -291,7 +596,7 @@ class BankAccount:
             raise ValueError("Deposit amount must be positive")
         
         self.balance += amount
-        self._log_transaction("Deposit", amount)
+        self._log_transaction(self.DEPOSIT, amount)
         print(f"✓ Deposited ${amount:.2f}")
         print(f"  New balance: ${self.balance:.2f}")
     
@@ -313,7 +618,7 @@ class BankAccount:
             raise InsufficientFundsError(self.balance, amount)
         
         self.balance -= amount
-        self._log_transaction("Withdrawal", amount)
+        self._log_transaction(self.WITHDRAWAL, amount)
         print(f"✓ Withdrew ${amount:.2f}")
         print(f"  New balance: ${self.balance:.2f}")
     
@@ -339,23 +644,83 @@ class BankAccount:
         self.balance -= amount
         other_account.balance += amount
         
-        self._log_transaction(f"Transfer to {other_account.account_number}", amount)
-        other_account._log_transaction(f"Transfer from {self.account_number}", amount)
+        self._log_transaction(self.TRANSFER_OUT, amount,
+                              other_account.account_number)
+        other_account._log_transaction(self.TRANSFER_IN, amount,
+                                       self.account_number)
         
         print(f"✓ Transferred ${amount:.2f} to account {other_account.account_number}")
         print(f"  Your new balance: ${self.balance:.2f}")
     
-    def _log_transaction(self, transaction_type, amount):
-        """Log transaction to history."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.transaction_history.append({
-            "timestamp": timestamp,
-            "type": transaction_type,
-            "amount": amount,
-            "balance": self.balance
-        })
-    
-    def show_history(self):
+    def _log_transaction(self, type_code, amount, counterparty=None):
+        """Log transaction to history (formatting happens in show_history)."""
+        history = self.transaction_history
+        if (self.history_file is not None and self.max_history is not None
+                and len(history) >= self.max_history):
+            self._spill_history()
+        history.append((time.time(), type_code, amount, self.balance,
+                        counterparty))
+
+    def _spill_history(self):
+        """Move the oldest half of the history to history_file."""
+        history = self.transaction_history
+        batch = max(1, self.max_history // 2)
+        evicted = [history.popleft() for _ in range(min(batch, len(history)))]
+
+        # One JSON array per line, tagged with the account number so a
+        # shared file can be filtered; JSON keeps ints, floats and None.
+        with open(self.history_file, 'a') as file:
+            for entry in evicted:
+                file.write(json.dumps([self.account_number, *entry]) + "\n")
+        self.spilled_count += len(evicted)
+
+    def _iter_own_rows(self):
+        """Yield this account's rows from the history file."""
+        with open(self.history_file, 'r') as file:
+            for line in file:
+                row = json.loads(line)
+                if row[0] == self.account_number:
+                    yield row[1:]
+
+    def _load_spilled_history(self):
+        """
+        Yield the entries this account spilled, read back from the file.
+
+        Rows of other accounts are skipped, and so are older rows of the
+        same account (e.g. left over from an earlier run): only the last
+        spilled_count rows belong to this object.
+        """
+        if self.history_file is None or not self.spilled_count:
+            return
+
+        total = sum(1 for _ in self._iter_own_rows())
+        stale = total - self.spilled_count
+        for index, (timestamp, type_code, amount, balance, counterparty) in enumerate(
+                self._iter_own_rows()):
+            if index >= stale:
+                yield timestamp, type_code, amount, balance, counterparty
+
+    def iter_history(self, include_spilled=True):
+        """
+        Yield transactions as dicts, oldest first.
+
+        Args:
+            include_spilled: Also read entries spilled to history_file
+        """
+        entries = self.transaction_history
+        if include_spilled:
+            entries = itertools.chain(self._load_spilled_history(), entries)
+
+        for timestamp, type_code, amount, balance, counterparty in entries:
+            yield {
+                "timestamp": datetime.fromtimestamp(timestamp).strftime(
+                    "%Y-%m-%d %H:%M:%S"),
+                "type": self.TYPE_LABELS[type_code].format(counterparty),
+                "amount": amount,
+                "balance": balance,
+            }
+
+    def show_history(self, include_spilled=True):
         """Display transaction history."""
         if not self.transaction_history:
             print("No transactions yet")
@@ -367,7 +732,7 @@ class BankAccount:
         print(f"{'Date/Time':<20} {'Type':<25} {'Amount':>10} {'Balance':>10}")
         print("-" * 70)
         
-        for trans in self.transaction_history:
+        for trans in self.iter_history(include_spilled):
             print(f"{trans['timestamp']:<20} {trans['type']:<25} "
                   f"${trans['amount']:>9.2f} ${trans['balance']:>9.2f}")
         
@@ -390,6 +755,9 @@ def retry_operation(func, max_attempts=3, *args, **kwargs):
     
     Raises:
         Exception from last failed attempt
+
+    See resilience.retry_call for backoff, jitter, time budgets and
+    circuit breaking.
     """
     last_exception = None
     
@@ -452,6 +820,10 @@ def demo_email_validation():
         except InvalidEmailError as e:
             print(f"✗ '{email}' is invalid: {e}")
 
+    print("\nBulk validation (error codes, no exceptions):")
+    for email, code in zip(test_emails, validate_emails_bulk(test_emails)):
+        print(f"  {code:>2}  {email:<20} {ERROR_MESSAGES[code]}")
+
 
 def demo_password_validation():
     """Demonstrate password validation."""
@@ -490,9 +862,40 @@ def demo_file_operations():
     # Read non-existent file
     print("\n3. Reading non-existent file:")
     safe_read_file("nonexistent.txt")
-    
+
+    # Stream large files in constant memory
+    print("\n4. Reading line by line:")
+    lines = safe_iter_lines("test_file.txt")
+    if lines is not None:
+        for number, line in enumerate(lines, 1):
+            print(f"  {number}: {line.rstrip()}")
+
+    print("\n5. Memory-mapped read:")
+    mapped = safe_mmap("test_file.txt")
+    if mapped is not None:
+        with mapped:
+            print(f"First line: {mapped.readline().decode().rstrip()}")
+
+    # Atomic batch write: a failure keeps the old content intact
+    print("\n6. Atomic batch write:")
+    try:
+        with SafeWriter("test_file.txt") as writer:
+            writer.write_records(f"record {i}" for i in range(1000))
+    except OSError as e:
+        print(f"✗ Error: {e}")
+
+    try:
+        with SafeWriter("test_file.txt") as writer:
+            writer.write_records(["partial"])
+            raise RuntimeError("Simulated crash")
+    except RuntimeError as e:
+        print(f"✗ {e}")
+    lines = safe_iter_lines("test_file.txt")
+    if lines is not None:
+        print(f"Still {sum(1 for _ in lines)} lines in file")
+
     # Delete file
-    print("\n4. Deleting file:")
+    print("\n7. Deleting file:")
     safe_delete_file("test_file.txt")
 
 
@@ -561,6 +964,28 @@ def demo_retry_mechanism():
     except Exception as e:
         print(f"✗ Final error: {e}")
 
+    print("\nRetry with exponential backoff and jitter:")
+    try:
+        result = retry_call(unstable_operation, max_attempts=5, base_delay=0.1,
+                            retry_on=(ConnectionError,), timeout=2.0)
+        print(f"✓ Result: {result}")
+    except Exception as e:
+        print(f"✗ Final error: {e}")
+
+    print("\nCircuit breaker (opens after 3 failures):")
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=5.0)
+
+    def broken_operation():
+        raise ConnectionError("Service unavailable")
+
+    for call in range(1, 6):
+        try:
+            breaker.call(broken_operation)
+        except CircuitOpenError as e:
+            print(f"  Call {call}: ✗ Rejected - {e}")
+        except ConnectionError as e:
+            print(f"  Call {call}: ✗ Failed - {e}")
+
 
 # ===== MAIN MENU =====
 
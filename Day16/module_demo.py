@@ -16,6 +16,15 @@ day16_module_system/
         converter.py
 """
 
+import os
+import sys
+
+# gcd and lcm live in Day12/number_theory.py; adding that folder to
+# sys.path makes it importable like a local module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Day12"))
+
+from number_theory import gcd, lcm
+
 # ===== SIMULATED MODULES (would normally be separate files) =====
 
 # ===== MODULE 1: string_utils.py =====
@@ -80,16 +89,6 @@ def is_prime(n):
             return False
     return True
 
-def gcd(a, b):
-    """Calculate greatest common divisor."""
-    while b:
-        a, b = b, a % b
-    return a
-
-def lcm(a, b):
-    """Calculate least common multiple."""
-    return abs(a * b) // gcd(a, b)
-
 def average(numbers):
     """Calculate average of numbers."""
     if not numbers: